@@ -0,0 +1,48 @@
+# __init__.py
+# IX-AntiGrav-Forge package root — installed as `ixag`
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+Every module in src/ is a submodule of `ixag`:
+
+    from ixag.waveform_cache import sine_wave
+    python -m ixag.frequency_gatekeeper
+    ixag run tesla_loop_modulator --out loop.npz       (see cli)
+
+Submodules load on first attribute access (ixag.tri_spin_interlock),
+so `import ixag` costs nothing beyond the interpreter. Numeric APIs
+need only numpy; matplotlib and scipy are imported the first time a
+plot or filter is actually used. import_benchmark tracks the
+cold-start cost of each module.
+"""
+
+import importlib
+
+__version__ = "0.1.0"
+
+MODULES = (
+    "acoustic_lift_matrix", "adaptive_grid", "aether_field_waveform", "aetheric_density_mapper",
+    "beam_containment_threshold", "buoyancy_field_driver", "cli", "control_loop_scheduler",
+    "dynamic_lift_feedback", "em_cloak_field_matrix", "em_inertia_map_model",
+    "energy_recirculation_node", "field_harmonic_generator", "field_loop_interferometer",
+    "field_stability_audit", "flux_lens_feedback", "flux_linked_feedback_ring",
+    "frequency_gatekeeper", "harmonic_field_lithography", "harmonic_stream",
+    "import_benchmark", "inertia_cancel_core", "inertial_dampening_matrix",
+    "lift_gain_autotuner", "longitudinal_pulse_harmonics", "phased_array_engine",
+    "plasma_cocoon_modeler", "plot_rendering", "radial_profile", "recursive_oscillator",
+    "self_sync_corrector", "sensor_recording", "sensor_ring_buffer",
+    "spin_control_unit", "spin_field_diagnostic", "surface_resonance_mapper",
+    "tesla_loop_modulator", "tiled_field", "tri_spin_interlock", "vector_force_equalizer",
+    "vortex_toroid_binder", "waveform_cache",
+)
+
+__all__ = list(MODULES)
+
+def __getattr__(name):
+    if name in MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(MODULES))
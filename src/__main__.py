@@ -0,0 +1,10 @@
+# __main__.py
+# `python -m ixag` runs the command line — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
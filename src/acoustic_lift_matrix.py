@@ -9,7 +9,7 @@ near-field levitation, focused pressure nodes, and
 EM field coupling via acoustic pressure modulation.
 
 Supports:
-- 8×8 grid (64-channel array)
+- 8×8 grid (64-channel array) or any phase-matrix shape
 - Phase shifting per transducer
 - Dynamic waveform input (optional Tesla harmonic integration)
 - Acoustic beam steering and trap zone formation
@@ -17,6 +17,8 @@ Supports:
 
 import numpy as np
 
+from .phased_array_engine import synthesize_phased_array, time_base
+
 # ------------------------------
 # PARAMETERS
 # ------------------------------
@@ -30,35 +32,20 @@ AMPLITUDE = 1.0                   # Signal strength (normalized)
 # SIGNAL GENERATION
 # ------------------------------
 
-def generate_phased_matrix(frequency, phase_matrix, amplitude, sample_rate, duration):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    signals = []
-
-    for i in range(GRID_SIZE):
-        row = []
-        for j in range(GRID_SIZE):
-            phase = phase_matrix[i][j]
-            signal = amplitude * np.sin(2 * np.pi * frequency * t + phase)
-            row.append(signal)
-        signals.append(row)
-
-    return np.array(signals)
+def generate_phased_matrix(frequency, phase_matrix, amplitude, sample_rate, duration, dtype=np.float64, out=None):
+    t = time_base(duration, sample_rate)
+    return synthesize_phased_array(phase_matrix, frequency, t, amplitude, dtype=dtype, out=out)
 
 # ------------------------------
 # PHASE STRATEGY EXAMPLE
 # ------------------------------
 
 def generate_focus_center_phases(grid_size):
-    center = (grid_size - 1) / 2.0
-    phase_matrix = np.zeros((grid_size, grid_size))
-    
-    for i in range(grid_size):
-        for j in range(grid_size):
-            dx = i - center
-            dy = j - center
-            distance = np.sqrt(dx**2 + dy**2)
-            phase_matrix[i][j] = -distance * np.pi / 4  # radial phase offset
-    return phase_matrix
+    rows, cols = (grid_size, grid_size) if np.isscalar(grid_size) else grid_size
+    dx = np.arange(rows)[:, None] - (rows - 1) / 2.0
+    dy = np.arange(cols)[None, :] - (cols - 1) / 2.0
+    distance = np.sqrt(dx**2 + dy**2)
+    return -distance * np.pi / 4  # radial phase offset
 
 # ------------------------------
 # MAIN TEST
@@ -0,0 +1,228 @@
+# adaptive_grid.py
+# Adaptive quadtree sampling of 2D field maps — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+Samples f(x, y) finely only where it bends.
+
+- Cells start as a uniform 2^min_level grid over `bounds`; each cell
+  probes f on its 3×3 nodes and is split into four while the bilinear
+  interpolant of its corners misses the edge midpoints or the center
+  by more than `tol` (curvature), or f changes by more than `grad_tol`
+  across it (gradient)
+- Nodes are shared between neighbours and parents and children, and
+  each one is evaluated only once
+- Leaves are kept as flat arrays (level, ix, iy, 4 corner values)
+  sorted by the Morton code of their lower-left corner, so the leaf
+  holding any point is one searchsorted away
+- resample() reconstructs any uniform grid from the leaves by bilinear
+  interpolation, band by band through tiled_field (memmaps included)
+
+Interpolation error is ~tol inside each leaf. Leaves of different sizes
+meet without stitching, so values can step by up to ~tol across such an
+edge. Features narrower than a min_level cell can slip between probes.
+"""
+
+import numpy as np
+
+from .tiled_field import TILE_CELLS, evaluate_tiled
+
+# ------------------------------
+# CONFIGURATION
+# ------------------------------
+
+ADAPTIVE_TOL = 1e-3               # Max bilinear miss at cell probes before splitting
+ADAPTIVE_MIN_LEVEL = 4            # Uniform starting grid: 2^4 = 16 cells a side
+ADAPTIVE_MAX_LEVEL = 12           # Finest cells: 2^12 = 4096 a side
+MORTON_MAX_LEVEL = 24             # Node keys must fit an int64
+
+# ------------------------------
+# MORTON CODES
+# ------------------------------
+
+def _spread_bits(v):
+    v = np.asarray(v, dtype=np.uint64) & np.uint64(0xFFFFFFFF)
+    for shift, mask in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF), (4, 0x0F0F0F0F0F0F0F0F),
+                        (2, 0x3333333333333333), (1, 0x5555555555555555)):
+        v = (v | (v << np.uint64(shift))) & np.uint64(mask)
+    return v
+
+def morton_code(ix, iy):
+    """
+    Z-order key interleaving the bits of integer cell coordinates
+    """
+    return _spread_bits(ix) | (_spread_bits(iy) << np.uint64(1))
+
+# ------------------------------
+# QUADTREE
+# ------------------------------
+
+class QuadtreeField:
+    """
+    Adaptive leaf cells of func(X, Y) over bounds = (x0, x1, y0, y1)
+    """
+
+    def __init__(self, func, bounds=(0.0, 1.0, 0.0, 1.0), tol=ADAPTIVE_TOL, grad_tol=None,
+                 min_level=ADAPTIVE_MIN_LEVEL, max_level=ADAPTIVE_MAX_LEVEL):
+        if not 0 <= min_level <= max_level <= MORTON_MAX_LEVEL:
+            raise ValueError(f"need 0 <= min_level <= max_level <= {MORTON_MAX_LEVEL}, "
+                             f"got {min_level}, {max_level}")
+        if tol <= 0:
+            raise ValueError(f"tol must be positive, got {tol}")
+        self.func = func
+        self.bounds = tuple(float(b) for b in bounds)
+        self.tol = tol
+        self.grad_tol = grad_tol
+        self.min_level = min_level
+        self.max_level = max_level
+        self._node_keys = np.empty(0, dtype=np.int64)
+        self._node_values = np.empty(0)
+        self._build()
+        self.evaluations = len(self._node_keys)
+        del self._node_keys, self._node_values
+
+    def __len__(self):
+        return len(self.level)
+
+    # --- node sampling -------------------------------------------------
+
+    def _sample(self, nx, ny):
+        """
+        func at finest-grid nodes (nx, ny), evaluating each node once
+        """
+        n = (1 << self.max_level) + 1
+        keys = ny * n + nx
+        new = np.unique(keys)
+        pos = np.searchsorted(self._node_keys, new)
+        seen = pos < len(self._node_keys)
+        seen[seen] = self._node_keys[pos[seen]] == new[seen]
+        new = new[~seen]
+
+        if len(new):
+            x0, x1, y0, y1 = self.bounds
+            scale = 1.0 / (n - 1)
+            values = self.func(x0 + (x1 - x0) * (new % n) * scale, y0 + (y1 - y0) * (new // n) * scale)
+            keys_all = np.concatenate([self._node_keys, new])
+            order = np.argsort(keys_all, kind="stable")
+            self._node_keys = keys_all[order]
+            self._node_values = np.concatenate([self._node_values, np.broadcast_to(values, new.shape)])[order]
+
+        return self._node_values[np.searchsorted(self._node_keys, keys)]
+
+    # --- refinement ----------------------------------------------------
+
+    def _build(self):
+        side = 1 << self.min_level
+        iy, ix = np.divmod(np.arange(side * side, dtype=np.int64), side)
+        leaves = []
+
+        for level in range(self.min_level, self.max_level + 1):
+            if not len(ix):
+                break
+            size = 1 << (self.max_level - level)
+            steps = np.array([0, size // 2, size]) if level < self.max_level else np.array([0, size])
+            nx = (ix * size)[:, None, None] + steps[None, None, :]
+            ny = (iy * size)[:, None, None] + steps[None, :, None]
+            nodes = self._sample(nx, ny)
+            corners = nodes[:, ::len(steps) - 1, ::len(steps) - 1].reshape(-1, 4)
+
+            if level == self.max_level:
+                leaves.append((level, ix, iy, corners))
+                break
+
+            c00, c01, c10, c11 = corners.T
+            miss = np.abs(np.stack([
+                nodes[:, 0, 1] - (c00 + c01) / 2, nodes[:, 2, 1] - (c10 + c11) / 2,
+                nodes[:, 1, 0] - (c00 + c10) / 2, nodes[:, 1, 2] - (c01 + c11) / 2,
+                nodes[:, 1, 1] - (c00 + c01 + c10 + c11) / 4,
+            ])).max(axis=0)
+            split = miss > self.tol
+            if self.grad_tol is not None:
+                flat = nodes.reshape(len(nodes), -1)
+                split |= flat.max(axis=1) - flat.min(axis=1) > self.grad_tol
+
+            keep = ~split
+            leaves.append((level, ix[keep], iy[keep], corners[keep]))
+            cx = (2 * ix[split])[:, None] + np.array([0, 1, 0, 1])
+            cy = (2 * iy[split])[:, None] + np.array([0, 0, 1, 1])
+            ix, iy = cx.ravel(), cy.ravel()
+
+        level = np.concatenate([np.full(len(c), lv, dtype=np.uint8) for lv, _, _, c in leaves])
+        ix = np.concatenate([x for _, x, _, _ in leaves])
+        iy = np.concatenate([y for _, _, y, _ in leaves])
+        corners = np.concatenate([c for _, _, _, c in leaves])
+
+        shift = (self.max_level - level).astype(np.uint64)
+        start = morton_code(ix.astype(np.uint64) << shift, iy.astype(np.uint64) << shift)
+        order = np.argsort(start)
+        self.level = level[order]
+        self.ix = ix[order].astype(np.uint32)
+        self.iy = iy[order].astype(np.uint32)
+        self.corners = corners[order]
+        self.start = start[order]
+
+    # --- queries -------------------------------------------------------
+
+    def leaf_bounds(self):
+        """
+        (n, 4) array of leaf (x0, x1, y0, y1), in Morton order
+        """
+        x0, x1, y0, y1 = self.bounds
+        size = 1.0 / (1 << self.level.astype(np.int64))
+        cx = x0 + (x1 - x0) * self.ix * size
+        cy = y0 + (y1 - y0) * self.iy * size
+        return np.stack([cx, cx + (x1 - x0) * size, cy, cy + (y1 - y0) * size], axis=1)
+
+    def _interpolate(self, x_row, y_col):
+        x0, x1, y0, y1 = self.bounds
+        fine = 1 << self.max_level
+        fx = (np.ravel(x_row) - x0) / (x1 - x0) * fine
+        fy = (np.ravel(y_col) - y0) / (y1 - y0) * fine
+        qx = np.clip(np.floor(fx), 0, fine - 1).astype(np.uint64)
+        qy = np.clip(np.floor(fy), 0, fine - 1).astype(np.uint64)
+
+        code = _spread_bits(qx)[None, :] | (_spread_bits(qy)[:, None] << np.uint64(1))
+        leaf = np.searchsorted(self.start, code, side="right") - 1
+
+        size = (1 << (self.max_level - self.level[leaf].astype(np.int64))).astype(np.float64)
+        u = np.clip((fx[None, :] - self.ix[leaf] * size) / size, 0.0, 1.0)
+        v = np.clip((fy[:, None] - self.iy[leaf] * size) / size, 0.0, 1.0)
+        c = self.corners[leaf]
+        bottom = c[..., 0] + (c[..., 1] - c[..., 0]) * u
+        top = c[..., 2] + (c[..., 3] - c[..., 2]) * u
+        return bottom + (top - bottom) * v
+
+    def resample(self, x, y, dtype=np.float64, directory=None, out=None, tile_cells=TILE_CELLS):
+        """
+        (len(y), len(x)) map rebuilt from the leaves; points outside
+        `bounds` take the nearest edge value
+        """
+        maps = evaluate_tiled(self._interpolate, ("field",), x, y, dtype, directory,
+                              out=None if out is None else {"field": out}, tile_cells=tile_cells)
+        return maps["field"]
+
+# ------------------------------
+# MAIN TEST
+# ------------------------------
+
+if __name__ == "__main__":
+    import time
+
+    from .aetheric_density_mapper import aether_density
+
+    start = time.perf_counter()
+    tree = QuadtreeField(aether_density)
+    t_build = time.perf_counter() - start
+
+    side = (1 << tree.max_level) + 1
+    x = y = np.linspace(0, 1, side)
+    start = time.perf_counter()
+    field = tree.resample(x, y)
+    t_resample = time.perf_counter() - start
+
+    exact = aether_density(x[None, :], y[:, None])
+    print(f"{len(tree)} leaves from {tree.evaluations} evaluations "
+          f"(uniform {side}² grid: {side * side}, {side * side / tree.evaluations:.0f}x more)")
+    print(f"build: {t_build * 1e3:.0f} ms  resample: {t_resample * 1e3:.0f} ms  "
+          f"max |err|: {np.max(np.abs(field - exact)):.1e}")
@@ -17,7 +17,10 @@ References:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import finish_figure, grid_stride, stride_grid
+from .radial_profile import RADIAL_STEP, RadialGrid
+from .tiled_field import TILE_CELLS, evaluate_tiled
 
 # ------------------------------
 # CONFIGURATION
@@ -29,36 +32,145 @@ FREQ = 3690
 AMPLITUDE = 1.0
 DURATION = 0.002
 SAMPLE_RATE = 1_000_000
+GRADIENT_MODES = ("numeric", "analytic")
+QUIVER_STEP = 8             # Cells between plotted gradient arrows
 
-def generate_aetheric_wave():
-    x = np.linspace(0, 1, GRID_RES)
-    y = np.linspace(0, 1, GRID_RES)
-    X, Y = np.meshgrid(x, y)
+def pulse_profile(dist, freq=FREQ, amplitude=AMPLITUDE):
+    r = dist + 1e-6  # avoid div by zero
+    return amplitude * np.sin(2 * np.pi * freq * r) * np.exp(-20 * r)
 
+def aether_pulse(X, Y):
     dx = X - CENTER[0]
     dy = Y - CENTER[1]
-    r = np.sqrt(dx**2 + dy**2) + 1e-6  # avoid div by zero
+    return pulse_profile(np.sqrt(dx**2 + dy**2))
+
+def aether_pulse_gradient(X, Y, freq=FREQ, amplitude=AMPLITUDE):
+    """
+    Pulse and its closed-form (grad_y, grad_x) in one pass, in physical
+    units (per unit of X, Y):
 
-    pulse = AMPLITUDE * np.sin(2 * np.pi * FREQ * r) * np.exp(-20 * r)
-    field_mod = np.gradient(pulse)
+        p(r)  = A sin(k r') e^(-20 r'),   r' = r + 1e-6,  k = 2π freq
+        p'(r) = A e^(-20 r') (k cos(k r') - 20 sin(k r'))
+        ∇p    = p'(r) (dy, dx) / r        (0 on the exact center)
+
+    The pulse matches pulse_profile bit for bit.
+    """
+    dx = X - CENTER[0]
+    dy = Y - CENTER[1]
+    dist = np.sqrt(dx**2 + dy**2)
+    r = dist + 1e-6
+    k = 2 * np.pi * freq
+
+    sin = np.sin(k * r)
+    cos = np.cos(k * r)
+    decay = np.exp(np.multiply(r, -20, out=r), out=r)
+    pulse = amplitude * sin * decay
+
+    cos *= k
+    sin *= 20
+    cos -= sin
+    cos *= decay
+    cos *= amplitude
+    radial = np.divide(cos, dist, out=dist, where=dist > 0)  # dist == 0 stays 0
+    grad_x = radial * dx
+    grad_y = np.multiply(radial, dy, out=radial)
+    return pulse, (grad_y, grad_x)
+
+def generate_aetheric_wave(gradient="numeric", quiver_only=False):
+    """
+    gradient="numeric"  : np.gradient of the pulse, in grid-index units
+    gradient="analytic" : aether_pulse_gradient, in physical units; exact
+                          even where FREQ outruns the grid resolution
+    quiver_only=True returns the gradient only every QUIVER_STEP cells,
+    the subsample plot_aether_wave draws (analytic mode then evaluates
+    nothing else).
+    """
+    if gradient not in GRADIENT_MODES:
+        raise ValueError(f"gradient must be one of {GRADIENT_MODES}, got {gradient!r}")
+    x = np.linspace(0, 1, GRID_RES)
+    y = np.linspace(0, 1, GRID_RES)
+    X, Y = np.meshgrid(x, y)
+    q = QUIVER_STEP
+
+    if gradient == "numeric":
+        pulse = aether_pulse(X, Y)
+        field_mod = np.gradient(pulse)
+        if quiver_only:
+            field_mod = tuple(g[::q, ::q] for g in field_mod)
+    elif quiver_only:
+        pulse = aether_pulse(X, Y)
+        _, field_mod = aether_pulse_gradient(x[None, ::q], y[::q, None])
+    else:
+        pulse, field_mod = aether_pulse_gradient(X, Y)
 
     return X, Y, pulse, field_mod
 
-def plot_aether_wave(X, Y, pulse, grad):
+def generate_aetheric_wave_tiled(resolution=GRID_RES, directory=None, dtype=np.float64, tile_cells=TILE_CELLS,
+                                 gradient="numeric"):
+    """
+    Out-of-core generate_aetheric_wave: returns the x, y axes, the
+    pulse map and its (grad_y, grad_x) gradient (index units, or
+    physical with gradient="analytic", which needs no halo), written
+    band by band (to .npy memmaps when `directory` is given)
+    """
+    if gradient not in GRADIENT_MODES:
+        raise ValueError(f"gradient must be one of {GRADIENT_MODES}, got {gradient!r}")
+    x = np.linspace(0, 1, resolution)
+    y = np.linspace(0, 1, resolution)
+
+    def kernel(x_row, y_col):
+        if gradient == "analytic":
+            pulse, (grad_y, grad_x) = aether_pulse_gradient(x_row, y_col)
+        else:
+            pulse = aether_pulse(x_row, y_col)
+            grad_y, grad_x = np.gradient(pulse)
+        return pulse, grad_y, grad_x
+
+    maps = evaluate_tiled(kernel, ("pulse", "grad_y", "grad_x"), x, y, dtype, directory,
+                          tile_cells=tile_cells, halo=1 if gradient == "numeric" else 0)
+    return x, y, maps["pulse"], (maps["grad_y"], maps["grad_x"])
+
+def aether_radial_grid(resolution=GRID_RES, step=RADIAL_STEP):
+    x = np.linspace(0, 1, resolution)
+    y = np.linspace(0, 1, resolution)
+    return RadialGrid(x, y, CENTER, step)
+
+def generate_aetheric_wave_radial(resolution=GRID_RES, freq=FREQ, amplitude=AMPLITUDE, step=RADIAL_STEP, out=None,
+                                  grid=None):
+    """
+    Pulse map through the radial fast path: returns the x, y axes and
+    the pulse, interpolated from a 1-D table (error ≤ max|f''|·step²/8).
+    Pass grid=aether_radial_grid(...) to reuse one index map across
+    frames; resolution and step then come from the grid.
+    """
+    grid = aether_radial_grid(resolution, step) if grid is None else grid
+    return grid.x, grid.y, grid.evaluate(lambda r: pulse_profile(r, freq, amplitude), out)
+
+def plot_aether_wave(X, Y, pulse, grad, save_path=None, scale=100):
+    """
+    grad may be full size or already sampled every QUIVER_STEP cells
+    (quiver_only). `scale` goes to plt.quiver as gradient units per
+    plot width of arrow, so larger values draw shorter arrows.
+    """
+    import matplotlib.pyplot as plt
+
+    s = grid_stride(pulse.shape)
+    q = s * QUIVER_STEP
+    g = s if grad[0].shape != pulse.shape else q
     plt.figure(figsize=(7, 6))
-    plt.contourf(X, Y, pulse, 120, cmap='viridis')
-    plt.quiver(X[::8, ::8], Y[::8, ::8], grad[1][::8, ::8], grad[0][::8, ::8], color='white', scale=100, width=0.003)
+    plt.contourf(stride_grid(X, s), stride_grid(Y, s), pulse[::s, ::s], 120, cmap='viridis')
+    plt.quiver(stride_grid(X, q), stride_grid(Y, q), grad[1][::g, ::g], grad[0][::g, ::g], color='white', scale=scale, width=0.003)
     plt.title("Aetheric Field Pressure Waveform from Tesla Pulse")
     plt.xlabel("X")
     plt.ylabel("Y")
     plt.axis("equal")
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
 # ------------------------------
 
 if __name__ == "__main__":
-    X, Y, pulse, grad = generate_aetheric_wave()
-    plot_aether_wave(X, Y, pulse, grad)
+    X, Y, pulse, grad = generate_aetheric_wave(gradient="analytic", quiver_only=True)
+    plot_aether_wave(X, Y, pulse, grad, scale=100 * 2 * np.pi * FREQ)  # arrows in wavenumbers
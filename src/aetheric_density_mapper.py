@@ -20,7 +20,10 @@ Real-world corollaries:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .adaptive_grid import ADAPTIVE_MAX_LEVEL, ADAPTIVE_TOL, QuadtreeField
+from .plot_rendering import finish_figure, grid_stride, stride_grid
+from .tiled_field import TILE_CELLS, evaluate_tiled
 
 # ------------------------------
 # SIMULATION CONFIG
@@ -31,33 +34,199 @@ SCAN_RADIUS = 1.0  # meter radius
 BASE_DENSITY = 1.0
 ANOMALY_MAGNITUDE = 0.6
 ANOMALY_CENTER = (0.35, 0.65)
+ANOMALY_WIDTH = 0.005      # exp(-dist² / width)
+ANOMALY_CUTOFF = 1e-6      # Contributions below this are dropped (sets each cutoff radius)
+ANOMALY_TILE = 32          # Cells per side of a spatial bucket / recompute tile
+
+def aether_density(X, Y):
+    # Gaussian anomaly simulating vacuum bubble or density void
+    dist_sq = (X - ANOMALY_CENTER[0])**2 + (Y - ANOMALY_CENTER[1])**2
+    anomaly = ANOMALY_MAGNITUDE * np.exp(-dist_sq / ANOMALY_WIDTH)
+
+    return BASE_DENSITY - anomaly
 
 def generate_aether_density_map():
     x = np.linspace(0, 1, GRID_RESOLUTION)
     y = np.linspace(0, 1, GRID_RESOLUTION)
     X, Y = np.meshgrid(x, y)
 
-    # Gaussian anomaly simulating vacuum bubble or density void
-    dist_sq = (X - ANOMALY_CENTER[0])**2 + (Y - ANOMALY_CENTER[1])**2
-    anomaly = ANOMALY_MAGNITUDE * np.exp(-dist_sq / 0.005)
-
-    density = BASE_DENSITY - anomaly
+    density = aether_density(X, Y)
     return X, Y, density
 
-def plot_density_map(X, Y, density):
+def generate_aether_density_map_tiled(resolution=GRID_RESOLUTION, directory=None, dtype=np.float64,
+                                      tile_cells=TILE_CELLS):
+    """
+    Out-of-core generate_aether_density_map: returns the x, y axes and
+    the density map, written band by band
+    """
+    x = np.linspace(0, 1, resolution)
+    y = np.linspace(0, 1, resolution)
+    maps = evaluate_tiled(aether_density, ("density",), x, y, dtype, directory, tile_cells=tile_cells)
+    return x, y, maps["density"]
+
+def generate_aether_density_map_adaptive(resolution=GRID_RESOLUTION, tol=ADAPTIVE_TOL, max_level=ADAPTIVE_MAX_LEVEL,
+                                        directory=None, dtype=np.float64):
+    """
+    Quadtree-sampled density map: refines only around the anomaly, then
+    resamples onto a uniform `resolution` grid. Returns the x, y axes,
+    the density map and the QuadtreeField (tree.resample(x, y) rebuilds
+    any other grid without new evaluations)
+    """
+    tree = QuadtreeField(aether_density, tol=tol, max_level=max_level)
+    x = np.linspace(0, 1, resolution)
+    y = np.linspace(0, 1, resolution)
+    return x, y, tree.resample(x, y, dtype, directory), tree
+
+# ------------------------------
+# MULTI-ANOMALY MAPS
+# ------------------------------
+
+class AnomalyMap:
+    """
+    Density map of many Gaussian anomalies on a uniform grid over [0, 1]².
+
+    Each anomaly is cut off at the radius where it falls below `cutoff`
+    and is bucketed into the tile × tile cell blocks its disc reaches,
+    so a block only sums the anomalies near it. add() and remove() mark
+    the blocks they touch; reading .density (or refresh()) recomputes
+    just those blocks. Ids returned by add() are never reused.
+    """
+
+    def __init__(self, resolution=GRID_RESOLUTION, base=BASE_DENSITY, cutoff=ANOMALY_CUTOFF,
+                 tile=ANOMALY_TILE, dtype=np.float64):
+        if cutoff <= 0:
+            raise ValueError(f"cutoff must be positive, got {cutoff}")
+        self.x = np.linspace(0, 1, resolution)
+        self.y = np.linspace(0, 1, resolution)
+        self.base = base
+        self.cutoff = cutoff
+        self.tile = tile
+        self.tiles = (-(-resolution // tile), -(-resolution // tile))
+
+        self.centers = np.empty((0, 2))
+        self.magnitudes = np.empty(0)
+        self.widths = np.empty(0)
+        self.radii = np.empty(0)
+        self.alive = np.empty(0, dtype=bool)
+
+        self._density = np.full((resolution, resolution), base, dtype=dtype)
+        self._dirty = np.zeros(self.tiles, dtype=bool)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    # --- spatial index -------------------------------------------------
+
+    def _tile_pairs(self, ids):
+        """
+        (anomaly id, flat tile index) for every tile each anomaly reaches
+        """
+        h = 1.0 / (len(self.x) - 1)
+        last = len(self.x) - 1
+        lo = np.clip(np.ceil((self.centers[ids] - self.radii[ids, None]) / h), 0, None).astype(np.int64)
+        hi = np.clip(np.floor((self.centers[ids] + self.radii[ids, None]) / h), None, last).astype(np.int64)
+        t0, t1 = lo // self.tile, hi // self.tile
+        nx = np.where((hi >= lo).all(axis=1), t1[:, 0] - t0[:, 0] + 1, 0)
+        ny = np.where(nx > 0, t1[:, 1] - t0[:, 1] + 1, 0)
+
+        counts = nx * ny
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        nx_rep = np.repeat(nx, counts)
+        tx = np.repeat(t0[:, 0], counts) + k % nx_rep
+        ty = np.repeat(t0[:, 1], counts) + k // nx_rep
+        return np.repeat(ids, counts), ty * self.tiles[1] + tx
+
+    # --- updates -------------------------------------------------------
+
+    def add(self, centers, magnitudes=ANOMALY_MAGNITUDE, widths=ANOMALY_WIDTH):
+        """
+        Adds anomalies at (n, 2) centers; returns their ids
+        """
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+        n = len(centers)
+        magnitudes = np.broadcast_to(np.asarray(magnitudes, dtype=np.float64), (n,))
+        widths = np.broadcast_to(np.asarray(widths, dtype=np.float64), (n,))
+        if np.any(widths <= 0):
+            raise ValueError("anomaly widths must be positive")
+
+        ids = np.arange(len(self.alive), len(self.alive) + n)
+        self.centers = np.concatenate([self.centers, centers])
+        self.magnitudes = np.concatenate([self.magnitudes, magnitudes])
+        self.widths = np.concatenate([self.widths, widths])
+        self.radii = np.concatenate([self.radii, np.sqrt(widths * np.log(np.maximum(np.abs(magnitudes) / self.cutoff, 1.0)))])
+        self.alive = np.concatenate([self.alive, np.ones(n, dtype=bool)])
+        self._dirty.flat[self._tile_pairs(ids)[1]] = True
+        return ids
+
+    def remove(self, ids):
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        if np.any((ids < 0) | (ids >= len(self.alive))) or not self.alive[ids].all():
+            raise ValueError("remove() got ids that are not live anomalies")
+        self.alive[ids] = False
+        self._dirty.flat[self._tile_pairs(ids)[1]] = True
+
+    def refresh(self):
+        """
+        Recomputes the dirty blocks; returns how many there were
+        """
+        dirty = np.flatnonzero(self._dirty)
+        if not len(dirty):
+            return 0
+
+        owners, tiles = self._tile_pairs(np.flatnonzero(self.alive))
+        order = np.argsort(tiles, kind="stable")
+        owners, tiles = owners[order], tiles[order]
+        first = np.searchsorted(tiles, dirty, side="left")
+        last = np.searchsorted(tiles, dirty, side="right")
+
+        for t, a, b in zip(dirty, first, last):
+            ty, tx = divmod(int(t), self.tiles[1])
+            rows = slice(ty * self.tile, (ty + 1) * self.tile)
+            cols = slice(tx * self.tile, (tx + 1) * self.tile)
+            ids = owners[a:b]
+            dx = self.x[cols][None, None, :] - self.centers[ids, 0, None, None]
+            dy = self.y[rows][None, :, None] - self.centers[ids, 1, None, None]
+            dist_sq = dx**2 + dy**2
+            anomaly = self.magnitudes[ids, None, None] * np.exp(-dist_sq / self.widths[ids, None, None])
+            anomaly[dist_sq > self.radii[ids, None, None] ** 2] = 0.0
+            self._density[rows, cols] = self.base - anomaly.sum(axis=0)
+
+        self._dirty[:] = False
+        return len(dirty)
+
+    @property
+    def density(self):
+        self.refresh()
+        return self._density
+
+def generate_aether_density_map_multi(centers, magnitudes=ANOMALY_MAGNITUDE, widths=ANOMALY_WIDTH,
+                                      resolution=GRID_RESOLUTION):
+    """
+    Density map of many anomalies: returns the x, y axes, the density
+    map and the AnomalyMap, for incremental add() / remove()
+    """
+    field = AnomalyMap(resolution)
+    field.add(centers, magnitudes, widths)
+    return field.x, field.y, field.density, field
+
+def plot_density_map(X, Y, density, save_path=None):
+    import matplotlib.pyplot as plt
+
+    s = grid_stride(density.shape)
     plt.figure(figsize=(6, 5))
-    contour = plt.contourf(X, Y, density, cmap='coolwarm')
+    contour = plt.contourf(stride_grid(X, s), stride_grid(Y, s), density[::s, ::s], cmap='coolwarm')
     plt.title("Aetheric Density Mapper")
     plt.xlabel("X (m)")
     plt.ylabel("Y (m)")
     plt.colorbar(contour, label='Relative Density')
     plt.grid(False)
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
 # ------------------------------
 
 if __name__ == "__main__":
-    X, Y, density = genera
+    X, Y, density = generate_aether_density_map()
+    plot_density_map(X, Y, density)
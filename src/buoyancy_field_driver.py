@@ -16,6 +16,10 @@ Can be used with:
 
 import numpy as np
 
+from .harmonic_stream import FRAME_SIZE, HarmonicFrameStream
+from .recursive_oscillator import harmonic_stack
+from .waveform_cache import time_base
+
 # ------------------------------
 # CONFIGURATION
 # ------------------------------
@@ -32,32 +36,45 @@ HARMONICS = [1, 2, 3]
 # SIGNAL ENGINE
 # ------------------------------
 
-def generate_buoyancy_wave(base_freq, harmonics, phase_offset_deg, duration, sample_rate):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    signal = np.zeros_like(t)
-
-    for h in harmonics:
-        phase_rad = np.deg2rad(phase_offset_deg * h)
-        f = base_freq * h
-        signal += np.sin(2 * np.pi * f * t + phase_rad)
+def generate_buoyancy_wave(base_freq, harmonics, phase_offset_deg, duration, sample_rate, backend="sin"):
+    t = time_base(duration, sample_rate)
+    phases = [np.deg2rad(phase_offset_deg * h) for h in harmonics]
+    signal = harmonic_stack(base_freq, harmonics, 1.0, phases, t, backend=backend, sample_rate=sample_rate)
 
     signal /= len(harmonics)
     return t, signal
 
+def stream_buoyancy_wave(base_freq, harmonics, phase_offset_deg, sample_rate, frame_size=FRAME_SIZE):
+    """
+    Endless, phase-continuous frame source equivalent to generate_buoyancy_wave
+    """
+    freqs = [base_freq * h for h in harmonics]
+    phases = [np.deg2rad(phase_offset_deg * h) for h in harmonics]
+    return HarmonicFrameStream(freqs, 1.0, phases, sample_rate, frame_size, norm=len(harmonics))
+
 # ------------------------------
-# MAIN EXECUTION
+# VISUALIZATION
 # ------------------------------
 
-if __name__ == "__main__":
-    t, wave = generate_buoyancy_wave(BASE_FREQ, HARMONICS, PHASE_OFFSET_DEGREES, DURATION, SAMPLE_RATE)
-
+def plot_buoyancy_wave(t, wave, save_path=None):
     import matplotlib.pyplot as plt
+    from .plot_rendering import decimate, finish_figure
+
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, wave, label="Neutral Buoyancy Field", color="green")
+    plt.plot(*decimate(t * 1000, wave), label="Neutral Buoyancy Field", color="green")
     plt.title("Phase-Offset Harmonic Lift Field (Tesla 3-6-9 Mode)")
     plt.xlabel("Time (ms)")
     plt.ylabel("Field Strength")
     plt.grid(True)
     plt.tight_layout()
     plt.legend()
-    plt.show()
+    return finish_figure(save_path)
+
+# ------------------------------
+# MAIN EXECUTION
+# ------------------------------
+
+if __name__ == "__main__":
+    t, wave = generate_buoyancy_wave(BASE_FREQ, HARMONICS, PHASE_OFFSET_DEGREES, DURATION, SAMPLE_RATE)
+
+    plot_buoyancy_wave(t, wave)
@@ -0,0 +1,381 @@
+# cli.py
+# Unified command line for running modules and parameter sweeps — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+One entry point for every generator in the package.
+
+    ixag list
+    ixag run longitudinal_pulse_harmonics --sample-rate 2e6 --duration 0.004 \\
+        --param amps=[1,0.5,0.25] --out pulse.npz
+    ixag batch tesla_loop_modulator sweep.jsonl --out sweep_store --workers 8
+
+run   : calls the module's generator once and writes its arrays to one .npz.
+        Parameters default to the module's own constants; --param k=v
+        overrides any of them (values are Python literals, else strings).
+batch : reads parameter sets (JSON lines, or one JSON list), one dict
+        per configuration, and fans fixed-size chunks of them out to a
+        process pool. Each worker writes its chunk straight to
+        <store>/chunk_NNNNN.npz (through a hidden .chunk_NNNNN.tmp.npz
+        renamed into place), so results never collect in the parent
+        and never cross the pool as pickles. Chunks already in the store
+        are skipped, which makes an interrupted sweep resumable. A
+        manifest.json records the module, parameter sets, chunk size
+        and seed; resuming with anything different is refused unless
+        --rebuild clears the old chunks. With --seed, each chunk seeds
+        np.random from (seed, chunk) so reruns reproduce it.
+        Throughput (configurations per second) is reported at the end.
+
+Chunk files hold the configuration indices, their parameter dicts
+(JSON) and each output stacked along a leading configuration axis, or
+stored per configuration as <name>_<index> when shapes differ.
+iter_store() reads a store back chunk by chunk.
+"""
+
+import argparse
+import ast
+import glob
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+# ------------------------------
+# CONFIGURATION
+# ------------------------------
+
+BATCH_CHUNK = 64                  # Configurations per pool task / chunk file
+INFLIGHT_PER_WORKER = 2           # Chunks queued per worker before submission waits
+CHUNK_NAME = re.compile(r"chunk_\d{5,}\.npz")  # Finished chunks only, never temp files
+
+Runner = namedtuple("Runner", "func outputs defaults")
+
+# defaults: parameter -> module constant name, or callable(module) -> value
+RUNNERS = {
+    "acoustic_lift_matrix": Runner(
+        "generate_phased_matrix", ("signals",),
+        {"frequency": "FREQ_HZ", "phase_matrix": lambda m: m.generate_focus_center_phases(m.GRID_SIZE),
+         "amplitude": "AMPLITUDE", "sample_rate": "SAMPLE_RATE", "duration": lambda m: 0.002}),
+    "aether_field_waveform": Runner("generate_aetheric_wave", ("X", "Y", "pulse", "grad"), {}),
+    "aetheric_density_mapper": Runner("generate_aether_density_map", ("X", "Y", "density"), {}),
+    "buoyancy_field_driver": Runner(
+        "generate_buoyancy_wave", ("t", "wave"),
+        {"base_freq": "BASE_FREQ", "harmonics": "HARMONICS", "phase_offset_deg": "PHASE_OFFSET_DEGREES",
+         "duration": "DURATION", "sample_rate": "SAMPLE_RATE"}),
+    "dynamic_lift_feedback": Runner("simulate_lift_feedback_batch", ("t", "outputs"), {}),
+    "em_cloak_field_matrix": Runner(
+        "generate_cloak_grid", ("field", "t"),
+        {"freq": "FREQ_BASE", "grid_size": "GRID_SIZE", "duration": "DURATION",
+         "sample_rate": "SAMPLE_RATE", "phase_offset": "PHASE_MOD"}),
+    "em_inertia_map_model": Runner("generate_inertia_field", ("X", "Y", "U", "V"), {}),
+    "energy_recirculation_node": Runner(
+        "generate_primary_wave", ("t", "wave"),
+        {"freq": "FREQ", "duration": "DURATION", "sample_rate": "SAMPLE_RATE"}),
+    "field_harmonic_generator": Runner(
+        "generate_369_harmonics", ("t", "signal"),
+        {"f_base": "BASE_FREQUENCY_HZ", "multipliers": "HARMONIC_MULTIPLIERS",
+         "sample_rate": "SAMPLE_RATE_HZ", "duration": "DURATION_SEC"}),
+    "field_loop_interferometer": Runner(
+        "generate_loop_wave", ("t", "ref", "test"),
+        {"freq": "BASE_FREQ", "delay_offset": "DELAY_DIFF", "duration": "DURATION", "sample_rate": "SAMPLE_RATE"}),
+    "field_stability_audit": Runner(
+        "generate_drifting_wave", ("t", "wave"),
+        {"freq": "FREQ", "duration": "DURATION", "sample_rate": "SAMPLE_RATE", "drift_factor": "DRIFT_FACTOR"}),
+    "flux_linked_feedback_ring": Runner(
+        "simulate_flux_ring", ("t", "ring", "feedback"),
+        {"freq": "FREQ", "duration": "DURATION", "sample_rate": "SAMPLE_RATE", "nodes": "RING_NODES"}),
+    "frequency_gatekeeper": Runner("generate_mixed_signal", ("t", "signal"), {}),
+    "harmonic_field_lithography": Runner(
+        "generate_harmonic_pattern", ("t", "beam"),
+        {"base": "BASE_FREQ", "harmonics": "HARMONICS", "duration": "DURATION", "sample_rate": "SAMPLE_RATE"}),
+    "inertial_dampening_matrix": Runner(
+        "generate_dampening_matrix", ("field", "t"),
+        {"grid_size": "GRID_SIZE", "freq": "FREQ_BASE", "duration": "DURATION",
+         "sample_rate": "SAMPLE_RATE", "phase_shift": "PHASE_NULL"}),
+    "longitudinal_pulse_harmonics": Runner(
+        "generate_longitudinal_pulse", ("t", "pulse"),
+        {"freqs": "FREQS", "amps": "AMPLITUDES", "duration": "DURATION", "sample_rate": "SAMPLE_RATE"}),
+    "plasma_cocoon_modeler": Runner("generate_cocoon_field", ("X", "Y", "field"), {}),
+    "self_sync_corrector": Runner(
+        "generate_unstable_wave", ("t", "wave"),
+        {"freq": "FREQ", "duration": "DURATION", "sample_rate": "SAMPLE_RATE"}),
+    "spin_control_unit": Runner(
+        "generate_spin_field", ("t", "wave"),
+        {"frequency": "FREQUENCY_HZ", "sample_rate": "SAMPLE_RATE_HZ", "duration": "DURATION_SEC",
+         "amp": "AMPLITUDE", "phase": "PHASE_A"}),
+    "spin_field_diagnostic": Runner(
+        "generate_spin_field", ("t", "wave"),
+        {"freq": "FREQ", "duration": "DURATION", "sample_rate": "SAMPLE_RATE", "asym_level": "ASYM_LEVEL"}),
+    "surface_resonance_mapper": Runner(
+        "simulate_material_surface", ("surface",),
+        {"grid_size": "GRID_SIZE", "base": "BASE_RESONANCE", "variance": "VARIANCE"}),
+    "tesla_loop_modulator": Runner(
+        "generate_369_loop", ("t", "wave"),
+        {"freq": "BASE_FREQ", "weights": "HARMONIC_WEIGHTS", "duration": "DURATION", "sample_rate": "SAMPLE_RATE"}),
+    "tri_spin_interlock": Runner(
+        "tri_axis_spin_system", ("t", "x", "y", "z"),
+        {"freq": "FREQ", "duration": "DURATION", "sample_rate": "SAMPLE_RATE"}),
+    "vortex_toroid_binder": Runner(
+        "generate_base_vortex_wave", ("t", "wave"),
+        {"freq_base": "FREQ_BASE", "harmonics": "HARMONICS", "duration": "DURATION", "sample_rate": "SAMPLE_RATE"}),
+}
+
+# ------------------------------
+# SINGLE RUN
+# ------------------------------
+
+def _runner(name):
+    if name not in RUNNERS:
+        raise ValueError(f"unknown module {name!r}, expected one of {sorted(RUNNERS)}")
+    spec = RUNNERS[name]
+    module = importlib.import_module(f"{__package__}.{name}")
+    return spec, module, getattr(module, spec.func)
+
+def resolve_params(name, overrides=None):
+    """
+    Full keyword set for the module's generator: module constants,
+    then signature defaults, then `overrides`
+    """
+    spec, module, func = _runner(name)
+    accepted = inspect.signature(func).parameters
+    overrides = dict(overrides or {})
+    unknown = set(overrides) - set(accepted)
+    if unknown:
+        raise ValueError(f"{name}.{spec.func} does not take {sorted(unknown)}; accepts {list(accepted)}")
+
+    params = {}
+    for key, param in accepted.items():
+        if key in overrides:
+            params[key] = overrides[key]
+        elif key in spec.defaults:
+            default = spec.defaults[key]
+            params[key] = default(module) if callable(default) else getattr(module, default)
+        elif param.default is inspect.Parameter.empty:
+            raise ValueError(f"{name}.{spec.func} needs a value for {key!r}")
+    return params
+
+def run_module(name, overrides=None):
+    """
+    Runs one configuration; returns {output name: array}
+    """
+    spec, _, func = _runner(name)
+    result = func(**resolve_params(name, overrides))
+    if not isinstance(result, tuple):
+        result = (result,)
+    return {key: np.asarray(value) for key, value in zip(spec.outputs, result)}
+
+def parse_param(text):
+    key, sep, raw = text.partition("=")
+    if not sep or not key:
+        raise ValueError(f"expected key=value, got {text!r}")
+    try:
+        return key, ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        return key, raw
+
+def _jsonable(params):
+    return json.dumps(params, default=lambda v: v.tolist() if isinstance(v, np.ndarray) else str(v))
+
+# ------------------------------
+# BATCH STORE
+# ------------------------------
+
+def load_param_sets(path):
+    with open(path) as f:
+        text = f.read()
+    stripped = text.lstrip()
+    if stripped.startswith("["):
+        param_sets = json.loads(stripped)
+    else:
+        param_sets = [json.loads(line) for line in text.splitlines() if line.strip()]
+    if not all(isinstance(p, dict) for p in param_sets):
+        raise ValueError(f"{path}: every parameter set must be a JSON object")
+    return param_sets
+
+def chunk_path(store, chunk):
+    return os.path.join(store, f"chunk_{chunk:05d}.npz")
+
+def _chunk_tmp_path(store, chunk):
+    # dot-prefixed and not chunk_*.npz, so a write cut short never looks like a chunk
+    return os.path.join(store, f".chunk_{chunk:05d}.tmp.npz")
+
+def _chunk_files(store):
+    """
+    Finished chunk files in `store`, in chunk order
+    """
+    return sorted(path for path in glob.glob(os.path.join(store, "chunk_*.npz"))
+                  if CHUNK_NAME.fullmatch(os.path.basename(path)))
+
+def _store_manifest(name, param_sets, chunk_size, seed):
+    digest = hashlib.sha256("\n".join(_jsonable(p) for p in param_sets).encode()).hexdigest()
+    return {"module": name, "configs": len(param_sets), "params_sha256": digest,
+            "chunk_size": chunk_size, "seed": seed}
+
+def _prepare_store(store, manifest, rebuild=False):
+    """
+    Checks (or writes) the store's manifest.json; with rebuild, a store
+    written for a different run is cleared instead of refused
+    """
+    path = os.path.join(store, "manifest.json")
+    os.makedirs(store, exist_ok=True)
+    chunks = _chunk_files(store)
+    if os.path.exists(path):
+        with open(path) as f:
+            current = json.load(f) == manifest
+    else:
+        current = not chunks
+    if current:
+        if not os.path.exists(path):
+            _write_manifest(path, manifest)
+        return
+    if not rebuild:
+        raise ValueError(f"store {store} holds chunks from a different batch "
+                         f"(module, parameter sets, chunk size or seed); use --rebuild or another --out")
+    for chunk in chunks + glob.glob(os.path.join(store, ".chunk_*.tmp.npz")):
+        os.remove(chunk)
+    _write_manifest(path, manifest)
+
+def _write_manifest(path, manifest):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp, path)
+
+def run_chunk(name, store, chunk, first_index, param_sets, seed=None):
+    """
+    Evaluates one chunk and writes it atomically; returns (chunk, configs, nbytes)
+    """
+    if seed is not None:
+        np.random.seed([seed, chunk])
+    results = [run_module(name, params) for params in param_sets]
+    arrays = {
+        "index": np.arange(first_index, first_index + len(param_sets)),
+        "params": np.array([_jsonable(p) for p in param_sets]),
+    }
+    for key in results[0]:
+        values = [r[key] for r in results]
+        if all(v.shape == values[0].shape for v in values):
+            arrays[key] = np.stack(values)
+        else:
+            arrays.update({f"{key}_{first_index + i}": v for i, v in enumerate(values)})
+
+    tmp = _chunk_tmp_path(store, chunk)
+    np.savez(tmp, **arrays)
+    os.replace(tmp, chunk_path(store, chunk))
+    return chunk, len(param_sets), sum(a.nbytes for a in arrays.values())
+
+def run_batch(name, param_sets, store, workers=None, chunk_size=BATCH_CHUNK, seed=None, rebuild=False):
+    """
+    Streams every configuration's outputs into `store`. Returns
+    (configs_run, chunks_skipped, seconds, bytes_written).
+    """
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    resolve_params(name, param_sets[0] if param_sets else None)  # fail fast on bad keys
+    _prepare_store(store, _store_manifest(name, param_sets, chunk_size, seed), rebuild)
+    chunks = [(chunk, start) for chunk, start in enumerate(range(0, len(param_sets), chunk_size))
+              if not os.path.exists(chunk_path(store, chunk))]
+    skipped = -(-len(param_sets) // chunk_size) - len(chunks)
+
+    configs = nbytes = 0
+    start_time = time.perf_counter()
+    limit = (workers or os.cpu_count() or 1) * INFLIGHT_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk, start in chunks:
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _, count, size = future.result()
+                    configs, nbytes = configs + count, nbytes + size
+            pending.add(pool.submit(run_chunk, name, store, chunk, start, param_sets[start:start + chunk_size], seed))
+        for future in pending:
+            _, count, size = future.result()
+            configs, nbytes = configs + count, nbytes + size
+    return configs, skipped, time.perf_counter() - start_time, nbytes
+
+def iter_store(store):
+    """
+    Yields each chunk of a batch store as a dict of arrays, in order
+    """
+    for path in _chunk_files(store):
+        with np.load(path, allow_pickle=False) as data:
+            yield {key: data[key] for key in data.files}
+
+# ------------------------------
+# COMMAND LINE
+# ------------------------------
+
+def _overrides(args):
+    overrides = dict(parse_param(p) for p in args.param)
+    if args.sample_rate is not None:
+        overrides["sample_rate"] = args.sample_rate
+    if args.duration is not None:
+        overrides["duration"] = args.duration
+    return overrides
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="ixag", description="Run IX-AntiGrav-Forge modules and write arrays to disk")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list runnable modules and their parameters")
+
+    for command in ("run", "batch"):
+        sub = commands.add_parser(command)
+        sub.add_argument("module", help="module name, e.g. tesla_loop_modulator")
+        if command == "batch":
+            sub.add_argument("param_file", help="JSON lines (or JSON list) of parameter sets")
+            sub.add_argument("--workers", type=int, default=None)
+            sub.add_argument("--chunk", type=int, default=BATCH_CHUNK, help="configurations per chunk file")
+            sub.add_argument("--seed", type=int, default=None, help="seed np.random per chunk")
+            sub.add_argument("--rebuild", action="store_true", help="clear a store written by a different batch")
+        sub.add_argument("--sample-rate", type=float, default=None)
+        sub.add_argument("--duration", type=float, default=None)
+        sub.add_argument("--param", action="append", default=[], metavar="KEY=VALUE")
+        sub.add_argument("--out", required=True,
+                         help="output .npz (run) or store directory (batch)")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return _dispatch(args)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+def _dispatch(args):
+    if args.command == "list":
+        for name in sorted(RUNNERS):
+            _, _, func = _runner(name)
+            print(f"{name:<30} {func.__name__}{inspect.signature(func)}")
+        return 0
+
+    overrides = _overrides(args)
+    if args.command == "run":
+        start = time.perf_counter()
+        arrays = run_module(args.module, overrides)
+        elapsed = time.perf_counter() - start
+        np.savez(args.out, params=np.array(_jsonable(resolve_params(args.module, overrides))), **arrays)
+        shapes = ", ".join(f"{k}{v.shape}" for k, v in arrays.items())
+        print(f"{args.module}: {shapes} in {elapsed * 1e3:.1f} ms → {args.out}")
+        return 0
+
+    param_sets = [{**overrides, **p} for p in load_param_sets(args.param_file)]
+    configs, skipped, elapsed, nbytes = run_batch(args.module, param_sets, args.out, args.workers, args.chunk,
+                                                 args.seed, args.rebuild)
+    rate = configs / elapsed if elapsed > 0 else float("inf")
+    print(f"{configs} configurations in {elapsed:.2f} s ({rate:.1f} configs/s, "
+          f"{nbytes / 1e6:.1f} MB written, {skipped} chunks already stored) → {args.out}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+# control_loop_scheduler.py
+# Fixed-rate asyncio scheduler for the feedback control loops — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+Runs several control loops together on one asyncio event loop,
+each at its own fixed rate (e.g. 1 kHz flux lens, 10 kHz IMU).
+
+- Deadlines come from the loop's monotonic clock:
+  deadline_k = start + k / rate, so timing error never accumulates
+- The selector only times out with ~1 ms granularity, so the last
+  spin_margin (default SPIN_MARGIN) before a deadline is spent
+  yielding to the loop instead of sleeping — that is what makes
+  10 kHz loops reachable, at the cost of keeping a core busy.
+  spin_margin=0 disables spinning: steps then start up to ~1 ms
+  late, but the loop sleeps between deadlines
+- Heavy numeric steps can be offloaded to a shared thread pool
+  (numpy releases the GIL for large array work)
+- A step that overruns its period counts as a deadline miss; the
+  missed periods are skipped rather than replayed in a burst
+
+Per-task statistics:
+- jitter    : how late each step started relative to its deadline
+- exec time : wall time of the step itself
+- misses    : steps that finished after the next deadline
+"""
+
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+# ------------------------------
+# CONFIGURATION
+# ------------------------------
+
+OFFLOAD_WORKERS = 4
+SPIN_MARGIN = 0.0015               # seconds before a deadline to stop sleeping and yield (0 = never spin)
+
+# ------------------------------
+# TASK STATISTICS
+# ------------------------------
+
+class TaskStats:
+    def __init__(self):
+        self.runs = 0
+        self.misses = 0
+        self.skipped_periods = 0
+        self.jitter_total = 0.0
+        self.jitter_max = 0.0
+        self.exec_total = 0.0
+        self.exec_max = 0.0
+
+    def record(self, jitter, exec_time):
+        self.runs += 1
+        self.jitter_total += jitter
+        self.jitter_max = max(self.jitter_max, jitter)
+        self.exec_total += exec_time
+        self.exec_max = max(self.exec_max, exec_time)
+
+    @property
+    def jitter_mean(self):
+        return self.jitter_total / self.runs if self.runs else 0.0
+
+    @property
+    def exec_mean(self):
+        return self.exec_total / self.runs if self.runs else 0.0
+
+class ControlTask:
+    def __init__(self, name, rate_hz, step, offload=False):
+        self.name = name
+        self.rate_hz = rate_hz
+        self.period = 1.0 / rate_hz
+        self.step = step
+        self.offload = offload
+        self.stats = TaskStats()
+
+# ------------------------------
+# SCHEDULER
+# ------------------------------
+
+class ControlLoopScheduler:
+    def __init__(self, offload_workers=OFFLOAD_WORKERS, spin_margin=SPIN_MARGIN):
+        if spin_margin < 0:
+            raise ValueError(f"spin_margin must be >= 0, got {spin_margin}")
+        self.tasks = []
+        self.offload_workers = offload_workers
+        self.spin_margin = spin_margin
+
+    def add_task(self, name, rate_hz, step, offload=False):
+        task = ControlTask(name, rate_hz, step, offload)
+        self.tasks.append(task)
+        return task
+
+    async def run(self, duration):
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=self.offload_workers) as pool:
+            start = loop.time()
+            await asyncio.gather(*(self._run_task(task, pool, start, start + duration) for task in self.tasks))
+        return {task.name: task.stats for task in self.tasks}
+
+    def run_for(self, duration):
+        return asyncio.run(self.run(duration))
+
+    async def _run_task(self, task, pool, start, stop_at):
+        loop = asyncio.get_running_loop()
+        stats = task.stats
+        k = 0
+
+        while True:
+            deadline = start + k * task.period
+            if deadline >= stop_at:
+                break
+            delay = deadline - loop.time()
+            if delay > self.spin_margin:
+                await asyncio.sleep(delay - self.spin_margin)
+            await asyncio.sleep(0)  # always let sibling loops run
+            if self.spin_margin:
+                while loop.time() < deadline:
+                    await asyncio.sleep(0)
+
+            began = loop.time()
+            if task.offload:
+                await loop.run_in_executor(pool, task.step)
+            else:
+                result = task.step()
+                if asyncio.iscoroutine(result):
+                    await result
+            finished = loop.time()
+            stats.record(began - deadline, finished - began)
+
+            k += 1
+            if finished > start + k * task.period:
+                stats.misses += 1
+                next_k = math.ceil((finished - start) / task.period)
+                stats.skipped_periods += next_k - k
+                k = next_k
+
+    def report(self):
+        lines = [f"{'task':<14}{'rate':>9}{'runs':>8}{'miss':>6}{'jitter avg/max (µs)':>22}{'exec avg/max (µs)':>20}"]
+        for task in self.tasks:
+            s = task.stats
+            lines.append(f"{task.name:<14}{task.rate_hz:>7.0f}Hz{s.runs:>8}{s.misses:>6}"
+                         f"{s.jitter_mean * 1e6:>12.1f}/{s.jitter_max * 1e6:<9.1f}"
+                         f"{s.exec_mean * 1e6:>10.1f}/{s.exec_max * 1e6:<9.1f}")
+        return "\n".join(lines)
+
+# ------------------------------
+# MAIN EXECUTION
+# ------------------------------
+
+if __name__ == "__main__":
+    from .flux_lens_feedback import flux_lens_step
+    from .inertia_cancel_core import inertia_cancel_step
+    from .self_sync_corrector import self_sync_step
+
+    scheduler = ControlLoopScheduler()
+    scheduler.add_task("flux_lens", 1000, flux_lens_step)
+    scheduler.add_task("imu_cancel", 10000, inertia_cancel_step)
+    scheduler.add_task("self_sync", 100, self_sync_step, offload=True)
+
+    scheduler.run_for(2.0)
+    print(scheduler.report())
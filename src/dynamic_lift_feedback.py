@@ -9,6 +9,10 @@ setpoint, and adjusts field gain accordingly.
 
 Prevents overshoot, wobble, drift, or oscillation collapse.
 
+simulate_lift_feedback_batch advances N independent controllers
+together as arrays (per-controller gains, setpoints and sensor noise)
+for Monte Carlo and gain-sweep studies.
+
 Real-world analogs:
 - PID controller (drones, rockets)
 - Magnetic suspension feedback loop
@@ -16,7 +20,8 @@ Real-world analogs:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import decimate, finish_figure
 
 # ------------------------------
 # CONFIGURATION
@@ -28,6 +33,9 @@ SETPOINT = 1.0  # Ideal lift amplitude
 GAIN_P = 2.0
 GAIN_D = 1.2
 GAIN_I = 0.5
+NOISE_LEVEL = 0.02  # Sensor noise (std dev)
+LOOP_RATE = 0.01    # Output slew per unit control effort
+SETTLING_BAND = 0.02  # ±2% of setpoint
 
 def simulate_lift_feedback():
     t = np.linspace(0, DURATION, int(SAMPLE_RATE * DURATION))
@@ -36,20 +44,103 @@ def simulate_lift_feedback():
     prev_error = 0
 
     for i in range(1, len(t)):
-        measured = output[i-1] + 0.02 * np.random.randn()  # simulate sensor noise
+        measured = output[i-1] + NOISE_LEVEL * np.random.randn()  # simulate sensor noise
         error = SETPOINT - measured
         error_sum += error
         d_error = error - prev_error
 
         control = GAIN_P * error + GAIN_I * error_sum + GAIN_D * d_error
-        output[i] = output[i-1] + 0.01 * control
+        output[i] = output[i-1] + LOOP_RATE * control
         prev_error = error
 
     return t, output
 
-def plot_feedback_response(t, output):
+# ------------------------------
+# BATCHED MONTE CARLO
+# ------------------------------
+
+def simulate_lift_feedback_batch(gain_p=GAIN_P, gain_i=GAIN_I, gain_d=GAIN_D, setpoint=SETPOINT,
+                                 noise_level=NOISE_LEVEL, n=None, duration=DURATION,
+                                 sample_rate=SAMPLE_RATE, seed=None, rng=None):
+    """
+    Runs N controllers side by side. Gains, setpoints and noise levels
+    are scalars or length-N arrays; N comes from `n` or their broadcast
+    length. Sensor noise for the whole run is drawn up front from a
+    seeded np.random.Generator. Returns t and (N, T) outputs.
+    """
+    t = np.linspace(0, duration, int(sample_rate * duration))
+    params = np.broadcast_arrays(*(np.atleast_1d(np.asarray(p, dtype=np.float64))
+                                   for p in (gain_p, gain_i, gain_d, setpoint, noise_level)))
+    count = params[0].size if n is None else n
+    kp, ki, kd, target, noise = (np.broadcast_to(p, (count,)) for p in params)
+
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    sensor_noise = rng.standard_normal((len(t), count))  # time-major: one contiguous row per step
+    sensor_noise *= noise
+
+    output = np.zeros((len(t), count))
+    error_sum = np.zeros(count)
+    prev_error = np.zeros(count)
+    error = np.empty(count)
+    control = np.empty(count)
+    scratch = np.empty(count)
+    kpd = kp + kd
+
+    for i in range(1, len(t)):
+        # error = setpoint - (previous output + sensor noise)
+        np.subtract(target, output[i-1], out=error)
+        error -= sensor_noise[i]
+        error_sum += error
+
+        # P*e + I*sum(e) + D*(e - e_prev), regrouped to reuse buffers
+        np.multiply(kpd, error, out=control)
+        np.multiply(ki, error_sum, out=scratch)
+        control += scratch
+        np.multiply(kd, prev_error, out=scratch)
+        control -= scratch
+
+        np.multiply(control, LOOP_RATE, out=output[i])
+        output[i] += output[i-1]
+        prev_error, error = error, prev_error
+
+    return t, np.ascontiguousarray(output.T)
+
+def summarize_response(t, outputs, setpoint=SETPOINT, band=SETTLING_BAND, tail=0.2):
+    """
+    Per-controller step-response metrics for (N, T) trajectories:
+    - overshoot           : peak above setpoint, as a fraction of setpoint
+    - settling_time       : first time after which output stays within ±band
+                            (np.inf if it never settles)
+    - steady_state_error  : mean |setpoint - output| over the final `tail` fraction
+    """
+    outputs = np.atleast_2d(outputs)
+    target = np.asarray(setpoint, dtype=np.float64).reshape(-1, 1)
+    scale = np.where(target == 0, 1.0, np.abs(target))
+
+    overshoot = np.maximum(np.max(outputs - target, axis=1), 0) / scale[:, 0]
+
+    outside = np.abs(outputs - target) > band * scale
+    last_outside = outputs.shape[1] - 1 - np.argmax(outside[:, ::-1], axis=1)
+    settled_idx = np.where(outside.any(axis=1), last_outside + 1, 0)
+    settling_time = np.full(outputs.shape[0], np.inf)
+    settles = settled_idx < outputs.shape[1]
+    settling_time[settles] = t[settled_idx[settles]]
+
+    tail_start = int(outputs.shape[1] * (1 - tail))
+    steady_state_error = np.mean(np.abs(target - outputs[:, tail_start:]), axis=1)
+
+    return {
+        "overshoot": overshoot,
+        "settling_time": settling_time,
+        "steady_state_error": steady_state_error,
+    }
+
+def plot_feedback_response(t, output, save_path=None):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 4))
-    plt.plot(t, output, label="Lift Field Output")
+    plt.plot(*decimate(t, output), label="Lift Field Output")
     plt.axhline(y=SETPOINT, color='red', linestyle='--', label='Setpoint')
     plt.title("Dynamic Lift Feedback Response")
     plt.xlabel("Time (s)")
@@ -57,7 +148,7 @@ def plot_feedback_response(t, output):
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
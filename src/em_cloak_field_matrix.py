@@ -21,6 +21,8 @@ Key Actions:
 
 import numpy as np
 
+from .phased_array_engine import synthesize_phased_array, time_base
+
 # ------------------------------
 # CONFIGURATION
 # ------------------------------
@@ -37,36 +39,44 @@ PHASE_MOD = np.pi / 2           # 90° destructive interference
 # MATRIX FIELD GENERATOR
 # ------------------------------
 
-def generate_cloak_grid(freq, grid_size, duration, sample_rate, phase_offset):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    grid = []
-
-    for i in range(grid_size):
-        row = []
-        for j in range(grid_size):
-            # Offset edge cells more than center
-            radial_phase = phase_offset * (np.abs(i - grid_size//2) + np.abs(j - grid_size//2)) / (grid_size / 2)
-            wave = AMPLITUDE * np.sin(2 * np.pi * freq * t + radial_phase)
-            row.append(wave)
-        grid.append(row)
+def generate_cloak_phases(grid_size, phase_offset):
+    rows, cols = (grid_size, grid_size) if np.isscalar(grid_size) else grid_size
+    i = np.arange(rows)[:, None]
+    j = np.arange(cols)[None, :]
+    # Offset edge cells more than center
+    return phase_offset * (np.abs(i - rows//2) + np.abs(j - cols//2)) / (max(rows, cols) / 2)
 
-    return np.array(grid), t
+def generate_cloak_grid(freq, grid_size, duration, sample_rate, phase_offset, dtype=np.float64, out=None):
+    t = time_base(duration, sample_rate)
+    phases = generate_cloak_phases(grid_size, phase_offset)
+    grid = synthesize_phased_array(phases, freq, t, AMPLITUDE, dtype=dtype, out=out)
+    return grid, t
 
 # ------------------------------
-# MAIN EXECUTION
+# VISUALIZATION
 # ------------------------------
 
-if __name__ == "__main__":
-    field_matrix, t = generate_cloak_grid(FREQ_BASE, GRID_SIZE, DURATION, SAMPLE_RATE, PHASE_MOD)
-
+def plot_cloak_cells(field_matrix, t, save_path=None):
     import matplotlib.pyplot as plt
+    from .plot_rendering import decimate, finish_figure
+
+    center = len(field_matrix) // 2
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, field_matrix[0][0], label="Corner Cell")
-    plt.plot(t * 1000, field_matrix[GRID_SIZE//2][GRID_SIZE//2], label="Center Cell", linestyle='--')
+    plt.plot(*decimate(t * 1000, field_matrix[0][0]), label="Corner Cell")
+    plt.plot(*decimate(t * 1000, field_matrix[center][center]), label="Center Cell", linestyle='--')
     plt.title("Electromagnetic Cloaking Field Signals — Phased Destructive Pattern")
     plt.xlabel("Time (ms)")
     plt.ylabel("Field Strength")
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
+
+# ------------------------------
+# MAIN EXECUTION
+# ------------------------------
+
+if __name__ == "__main__":
+    field_matrix, t = generate_cloak_grid(FREQ_BASE, GRID_SIZE, DURATION, SAMPLE_RATE, PHASE_MOD)
+
+    plot_cloak_cells(field_matrix, t)
@@ -16,7 +16,10 @@ Real-world analogs:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import finish_figure, grid_stride, stride_grid
+from .radial_profile import RadialGrid
+from .tiled_field import TILE_CELLS, evaluate_tiled
 
 # ------------------------------
 # CONFIGURATION
@@ -27,25 +30,86 @@ CENTER = (0.5, 0.5)
 FIELD_STRENGTH = 1.0
 DECAY_RADIUS = 0.4
 DISTORTION_FACTOR = 1.8
+PROFILE_STEP = 1e-5  # radial table spacing for the h_c / h_s tables
 
-def generate_inertia_field():
-    x = np.linspace(0, 1, GRID_SIZE)
-    y = np.linspace(0, 1, GRID_SIZE)
-    X, Y = np.meshgrid(x, y)
+def magnitude_profile(r, field_strength=FIELD_STRENGTH, decay_radius=DECAY_RADIUS):
+    return field_strength * np.exp(-r / decay_radius)
 
+def inertia_vectors(X, Y):
     dx = X - CENTER[0]
     dy = Y - CENTER[1]
     r = np.sqrt(dx**2 + dy**2)
 
-    field_mag = FIELD_STRENGTH * np.exp(-r / DECAY_RADIUS)
+    field_mag = magnitude_profile(r)
     theta = np.arctan2(dy, dx)
 
     U = field_mag * np.cos(theta + DISTORTION_FACTOR * r)
     V = field_mag * np.sin(theta + DISTORTION_FACTOR * r)
 
+    return U, V
+
+def generate_inertia_field():
+    x = np.linspace(0, 1, GRID_SIZE)
+    y = np.linspace(0, 1, GRID_SIZE)
+    X, Y = np.meshgrid(x, y)
+
+    U, V = inertia_vectors(X, Y)
     return X, Y, U, V
 
-def plot_inertia_map(X, Y, U, V):
+def generate_inertia_field_tiled(resolution=GRID_SIZE, directory=None, dtype=np.float64, tile_cells=TILE_CELLS):
+    """
+    Out-of-core generate_inertia_field: returns the x, y axes and the
+    U, V maps, written band by band
+    """
+    x = np.linspace(0, 1, resolution)
+    y = np.linspace(0, 1, resolution)
+    maps = evaluate_tiled(inertia_vectors, ("U", "V"), x, y, dtype, directory, tile_cells=tile_cells)
+    return x, y, maps["U"], maps["V"]
+
+def inertia_radial_grid(resolution=GRID_SIZE, step=PROFILE_STEP):
+    x = np.linspace(0, 1, resolution)
+    y = np.linspace(0, 1, resolution)
+    return RadialGrid(x, y, CENTER, step)
+
+def generate_inertia_field_radial(resolution=GRID_SIZE, field_strength=FIELD_STRENGTH, decay_radius=DECAY_RADIUS,
+                                  distortion=DISTORTION_FACTOR, step=PROFILE_STEP, grid=None):
+    """
+    U, V through the radial fast path. With cos θ = dx / r, sin θ = dy / r:
+        U = (dx·h_c(r) − dy·h_s(r)) / r,  V = (dx·h_s(r) + dy·h_c(r)) / r
+    where h_c = |F| cos(k r) and h_s = |F| sin(k r) are bounded radial
+    tables, so the error stays at the table's max|h''|·step²/8 right up
+    to the center. Returns the x, y axes and U, V. Pass
+    grid=inertia_radial_grid(...) to reuse one index map across frames.
+    """
+    grid = inertia_radial_grid(resolution, step) if grid is None else grid
+    x, y, step = grid.x, grid.y, grid.step
+
+    r = grid.radii
+    mag = magnitude_profile(r, field_strength, decay_radius)
+    h_c = grid.apply(mag * np.cos(distortion * r))
+    h_s = grid.apply(mag * np.sin(distortion * r))
+
+    dx = (x - CENTER[0])[None, :]
+    dy = (y - CENTER[1])[:, None]
+    dist = np.sqrt(dx**2 + dy**2)
+    U = h_c * dx
+    U -= h_s * dy
+    V = h_s * dx
+    V += h_c * dy
+
+    # θ = arctan2(0, 0) = 0 at the center node, if the grid has one
+    center = dist <= 1e-9 * step
+    np.divide(U, dist, out=U, where=~center)
+    np.divide(V, dist, out=V, where=~center)
+    U[center] = field_strength
+    V[center] = 0.0
+    return x, y, U, V
+
+def plot_inertia_map(X, Y, U, V, save_path=None):
+    import matplotlib.pyplot as plt
+
+    s = grid_stride(U.shape)
+    X, Y, U, V = stride_grid(X, s), stride_grid(Y, s), U[::s, ::s], V[::s, ::s]
     plt.figure(figsize=(6, 6))
     plt.streamplot(X, Y, U, V, color=np.sqrt(U**2 + V**2), cmap='magma', density=1.2)
     plt.title("EM-Induced Inertial Flow Field")
@@ -55,7 +119,7 @@ def plot_inertia_map(X, Y, U, V):
     plt.axis("equal")
     plt.colorbar(label="Inertial Vector Magnitude")
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
@@ -19,7 +19,9 @@ Inspired by:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import decimate, finish_figure
+from .waveform_cache import sine_wave, time_base
 
 # ------------------------------
 # CONFIGURATION
@@ -32,8 +34,8 @@ DECAY = 0.15  # energy bleed-off
 REINFORCE_GAIN = 0.25
 
 def generate_primary_wave(freq, duration, sample_rate):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    wave = np.sin(2 * np.pi * freq * t)
+    t = time_base(duration, sample_rate)
+    wave = sine_wave(freq, duration, sample_rate)
     return t, wave
 
 def simulate_energy_return(wave, decay, gain):
@@ -45,17 +47,19 @@ def simulate_energy_return(wave, decay, gain):
 # VISUALIZATION
 # ------------------------------
 
-def plot_energy_recirculation(t, original, reinforced):
+def plot_energy_recirculation(t, original, reinforced, save_path=None):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, original, label="Original Wave", alpha=0.5)
-    plt.plot(t * 1000, reinforced, label="Reinforced (Recycled Energy)", color='orange')
+    plt.plot(*decimate(t * 1000, original), label="Original Wave", alpha=0.5)
+    plt.plot(*decimate(t * 1000, reinforced), label="Reinforced (Recycled Energy)", color='orange')
     plt.title("Energy Recirculation Loop — Harmonic Reinforcement")
     plt.xlabel("Time (ms)")
     plt.ylabel("Amplitude")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
@@ -17,7 +17,10 @@ bus lines using microcontroller platforms (e.g., STM32, RP2040, Teensy).
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .harmonic_stream import FRAME_SIZE, HarmonicFrameStream
+from .plot_rendering import decimate, finish_figure
+from .waveform_cache import sine_wave, time_base
 
 # ------------------------------
 # CONFIGURATION PARAMETERS
@@ -33,17 +36,41 @@ HARMONIC_MULTIPLIERS = [1, 2, 3]  # Corresponds to 3k, 6k, 9k
 # ------------------------------
 
 def generate_369_harmonics(f_base, multipliers, sample_rate, duration):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+    t = time_base(duration, sample_rate)
     signal = np.zeros_like(t)
     
     for n in multipliers:
         harmonic_freq = f_base * n
-        signal += np.sin(2 * np.pi * harmonic_freq * t)
+        signal += sine_wave(harmonic_freq, duration, sample_rate)
 
     # Normalize
     signal /= len(multipliers)
     return t, signal
 
+def stream_369_harmonics(f_base, multipliers, sample_rate, frame_size=FRAME_SIZE):
+    """
+    Endless, phase-continuous frame source equivalent to generate_369_harmonics
+    """
+    freqs = [f_base * n for n in multipliers]
+    return HarmonicFrameStream(freqs, 1.0, 0.0, sample_rate, frame_size, norm=len(multipliers))
+
+# ------------------------------
+# VISUALIZATION
+# ------------------------------
+
+def plot_369_harmonics(t, waveform, save_path=None):
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 4))
+    plt.plot(*decimate(t * 1000, waveform), label="3-6-9 Harmonic Signal", color='blue')
+    plt.title("Tesla Harmonic Field Drive Signal (3-6-9)")
+    plt.xlabel("Time (ms)")
+    plt.ylabel("Amplitude")
+    plt.grid(True)
+    plt.legend()
+    plt.tight_layout()
+    return finish_figure(save_path)
+
 # ------------------------------
 # MAIN EXECUTION BLOCK
 # ------------------------------
@@ -56,13 +83,4 @@ if __name__ == "__main__":
         duration=DURATION_SEC
     )
 
-    # Plotting
-    plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, waveform, label="3-6-9 Harmonic Signal", color='blue')
-    plt.title("Tesla Harmonic Field Drive Signal (3-6-9)")
-    plt.xlabel("Time (ms)")
-    plt.ylabel("Amplitude")
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    plot_369_harmonics(t, waveform)
@@ -22,7 +22,9 @@ Compatible with:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import decimate, finish_figure
+from .waveform_cache import sine_wave, time_base
 
 # ------------------------------
 # CONFIGURATION
@@ -34,9 +36,9 @@ DURATION = 0.005
 SAMPLE_RATE = 192000
 
 def generate_loop_wave(freq, delay_offset, duration, sample_rate):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    ref_wave = np.sin(2 * np.pi * freq * t)
-    test_wave = np.sin(2 * np.pi * freq * (t + delay_offset))
+    t = time_base(duration, sample_rate)
+    ref_wave = sine_wave(freq, duration, sample_rate)
+    test_wave = sine_wave(freq, duration, sample_rate, 2 * np.pi * freq * delay_offset)
     return t, ref_wave, test_wave
 
 def analyze_interference(ref, test):
@@ -46,18 +48,20 @@ def analyze_interference(ref, test):
 # VISUALIZATION
 # ------------------------------
 
-def plot_interference(t, ref, test, output):
+def plot_interference(t, ref, test, output, save_path=None):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 5))
-    plt.plot(t * 1000, ref, label="Reference Path", alpha=0.5)
-    plt.plot(t * 1000, test, label="Test Path", alpha=0.5)
-    plt.plot(t * 1000, output, label="Interference Output", color="red")
+    plt.plot(*decimate(t * 1000, ref), label="Reference Path", alpha=0.5)
+    plt.plot(*decimate(t * 1000, test), label="Test Path", alpha=0.5)
+    plt.plot(*decimate(t * 1000, output), label="Interference Output", color="red")
     plt.title("Harmonic Field Loop Interferometer")
     plt.xlabel("Time (ms)")
     plt.ylabel("Amplitude")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
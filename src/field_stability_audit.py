@@ -13,6 +13,15 @@ Monitors live harmonic field signals for:
 Auto-detects instability and prepares flags for real-time adjustment
 via external modulation hardware or internal signal re-synchronization.
 
+OnlineStabilityAuditor is the streaming form of check_stability: it
+tracks the spread of the first difference over a sliding window
+(exact rectangular window or exponentially weighted) at O(1) cost per
+sample, independent of the window length: the window mode keeps a
+fixed per-channel ring of the last `window` diffs with a running sum
+and sum of squares. It takes blocks of any size for any number of
+channels and emits timestamped, hysteresis-debounced threshold
+crossings.
+
 Real-world analogs:
 - RF carrier envelope monitoring
 - Phase-lock loop error correction
@@ -20,7 +29,9 @@ Real-world analogs:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import decimate, finish_figure
+from .waveform_cache import time_base
 
 # ------------------------------
 # CONFIGURATION
@@ -30,9 +41,20 @@ FREQ = 3330
 SAMPLE_RATE = 192000
 DURATION = 0.01
 DRIFT_FACTOR = 0.005  # frequency drift per ms
+AUDIT_WINDOW = 1024   # samples in the sliding instability window
+HYSTERESIS = 0.1      # clear below tolerance * (1 - HYSTERESIS)
+AUDIT_MODES = ("window", "ewma")
+
+AUDIT_EVENT_DTYPE = np.dtype([
+    ("channel", np.int32),
+    ("sample", np.int64),
+    ("time", np.float64),
+    ("unstable", np.bool_),
+    ("score", np.float64),
+])
 
 def generate_drifting_wave(freq, duration, sample_rate, drift_factor):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+    t = time_base(duration, sample_rate)
     freq_drift = freq + drift_factor * t * 1000
     wave = np.sin(2 * np.pi * freq_drift * t)
     return t, wave
@@ -42,20 +64,170 @@ def check_stability(wave, tolerance=0.05):
     instability_score = np.std(delta)  # measure variance
     return instability_score > tolerance, instability_score
 
+# ------------------------------
+# ONLINE AUDITOR
+# ------------------------------
+
+class OnlineStabilityAuditor:
+    """
+    Streaming instability monitor for (channels, samples) blocks.
+    process() returns an AUDIT_EVENT_DTYPE array with one entry per
+    stable/unstable transition; `score` holds the latest per-channel
+    instability score.
+    """
+
+    def __init__(self, channels=1, tolerance=0.05, window=AUDIT_WINDOW, hysteresis=HYSTERESIS,
+                 sample_rate=SAMPLE_RATE, mode="window"):
+        if mode not in AUDIT_MODES:
+            raise ValueError(f"unknown mode {mode!r}, expected one of {AUDIT_MODES}")
+        self.channels = channels
+        self.high = tolerance
+        self.low = tolerance * (1 - hysteresis)
+        self.window = window
+        self.sample_rate = sample_rate
+        self.mode = mode
+        self.alpha = 2.0 / (window + 1)
+        self.reset()
+
+    def reset(self):
+        self.samples_seen = 0
+        self.unstable = np.zeros(self.channels, dtype=bool)
+        self.score = np.zeros(self.channels)
+        self._last = None
+        self._ring = np.zeros((self.channels, self.window))  # window mode: last `window` diffs
+        self._diffs_seen = 0                                 # diff k lives in slot k % window
+        self._sum = np.zeros(self.channels)
+        self._sum_sq = np.zeros(self.channels)
+        self._since_resum = 0
+        self._mean = np.zeros(self.channels)            # ewma mode
+        self._var = np.zeros(self.channels)
+
+    def process(self, block):
+        block = np.asarray(block, dtype=np.float64).reshape(self.channels, -1)
+        if block.shape[1] == 0:
+            return np.zeros(0, dtype=AUDIT_EVENT_DTYPE)
+
+        # First difference, continued across block boundaries
+        if self._last is None:
+            delta = np.diff(block, axis=1)
+            first_sample = self.samples_seen + 1
+        else:
+            delta = np.diff(block, axis=1, prepend=self._last[:, None])
+            first_sample = self.samples_seen
+        self._last = block[:, -1].copy()
+        self.samples_seen += block.shape[1]
+        if delta.shape[1] == 0:
+            return np.zeros(0, dtype=AUDIT_EVENT_DTYPE)
+
+        if self.mode == "window":
+            scores = self._window_scores(delta)
+        else:
+            scores = self._ewma_scores(delta)
+        self.score = scores[:, -1].copy()
+        return self._crossings(scores, first_sample)
+
+    def _window_scores(self, delta):
+        # Running sums over the ring: each new diff adds itself and removes the
+        # diff `window` samples back (from the ring, or from this block when
+        # the block is longer than the window), so a block costs O(block).
+        w = self.window
+        n = delta.shape[1]
+        seen = self._diffs_seen
+        j = np.arange(n)
+
+        leaving = np.zeros_like(delta)
+        old = j[:min(n, w)]
+        old = old[seen + old >= w]
+        leaving[:, old] = self._ring[:, (seen + old) % w]
+        if n > w:
+            leaving[:, w:] = delta[:, :n - w]
+
+        s1 = np.cumsum(delta - leaving, axis=1)
+        s1 += self._sum[:, None]
+        s2 = np.cumsum(delta * delta - leaving * leaving, axis=1)
+        s2 += self._sum_sq[:, None]
+
+        count = np.minimum(seen + j + 1, w).astype(np.float64)
+        mean = s1 / count
+        var = s2 / count
+        var -= mean * mean
+        np.maximum(var, 0, out=var)
+
+        kept = min(n, w)
+        self._ring[:, (seen + np.arange(n - kept, n)) % w] = delta[:, n - kept:]
+        self._diffs_seen = seen + n
+        self._sum = s1[:, -1].copy()
+        self._sum_sq = s2[:, -1].copy()
+        self._since_resum += n
+        if self._since_resum >= w:
+            # re-sum the ring once per window to stop rounding drift (amortized O(1))
+            self._sum = self._ring.sum(axis=1)
+            self._sum_sq = np.einsum("ij,ij->i", self._ring, self._ring)
+            self._since_resum = 0
+        return np.sqrt(var, out=var)
+
+    def _ewma_scores(self, delta):
+        from scipy.signal import lfilter
+
+        a = self.alpha
+        decay = [1.0, -(1 - a)]
+        mean = lfilter([a], decay, delta, axis=1, zi=((1 - a) * self._mean)[:, None])[0]
+        prev_mean = np.concatenate([self._mean[:, None], mean[:, :-1]], axis=1)
+        innovation = a * (1 - a) * (delta - prev_mean) ** 2
+        var = lfilter([1.0], decay, innovation, axis=1, zi=((1 - a) * self._var)[:, None])[0]
+        self._mean = mean[:, -1].copy()
+        self._var = var[:, -1].copy()
+        return np.sqrt(np.maximum(var, 0, out=var), out=var)
+
+    def _crossings(self, scores, first_sample):
+        # Hysteresis: above high -> unstable, below low -> stable, between -> hold.
+        # Only channels that touch the opposite threshold can transition.
+        flips = np.where(self.unstable[:, None], scores < self.low, scores > self.high).any(axis=1)
+        if not flips.any():
+            return np.zeros(0, dtype=AUDIT_EVENT_DTYPE)
+        active = np.nonzero(flips)[0]
+        scores = scores[active]
+        current = self.unstable[active]
+
+        n = scores.shape[1]
+        code = np.full(scores.shape, -1, dtype=np.int8)
+        code[scores > self.high] = 1
+        code[scores < self.low] = 0
+
+        last_set = np.where(code >= 0, np.arange(n), -1)
+        np.maximum.accumulate(last_set, axis=1, out=last_set)
+        rows = np.arange(active.size)[:, None]
+        state = np.where(last_set >= 0, code[rows, np.maximum(last_set, 0)] == 1, current[:, None])
+
+        previous = np.concatenate([current[:, None], state[:, :-1]], axis=1)
+        row, idx = np.nonzero(state != previous)
+        self.unstable[active] = state[:, -1]
+
+        events = np.empty(row.size, dtype=AUDIT_EVENT_DTYPE)
+        events["channel"] = active[row]
+        events["sample"] = first_sample + idx
+        events["time"] = events["sample"] / self.sample_rate
+        events["unstable"] = state[row, idx]
+        events["score"] = scores[row, idx]
+        order = np.argsort(events["sample"], kind="stable")
+        return events[order]
+
 # ------------------------------
 # VISUALIZATION
 # ------------------------------
 
-def plot_wave_drift(t, wave, instability_score):
+def plot_wave_drift(t, wave, instability_score, save_path=None):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, wave, label="Live Harmonic Signal")
+    plt.plot(*decimate(t * 1000, wave), label="Live Harmonic Signal")
     plt.title(f"Field Stability Audit — Instability Score: {instability_score:.4f}")
     plt.xlabel("Time (ms)")
     plt.ylabel("Amplitude")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
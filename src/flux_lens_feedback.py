@@ -29,25 +29,43 @@ def read_flux_ring(num_sensors=8):
     # Simulate flux ring with random small perturbations
     return np.random.normal(loc=0.0, scale=0.005, size=num_sensors)
 
+def read_flux_ring_batch(frames, num_sensors=8):
+    # Block of consecutive ring readings: (frames, num_sensors)
+    return np.random.normal(loc=0.0, scale=0.005, size=(frames, num_sensors))
+
 # ------------------------------
 # CURVATURE EVALUATION
 # ------------------------------
+# Sensors run along the last axis: one ring (num_sensors,) or a batch (frames, num_sensors)
 
 def compute_field_symmetry(flux_values):
-    mean_val = np.mean(flux_values)
-    deviation = np.std(flux_values)
+    mean_val = np.mean(flux_values, axis=-1)
+    deviation = np.std(flux_values, axis=-1)
     return mean_val, deviation
 
 def generate_compensation_vector(flux_values):
-    mean_val = np.mean(flux_values)
+    mean_val = np.mean(flux_values, axis=-1, keepdims=True)
     delta = flux_values - mean_val
     return -1 * delta  # Invert delta to flatten the field bubble
 
+def flux_lens_step(num_sensors=8):
+    """
+    One control cycle: read the ring, return the compensation vector
+    """
+    return generate_compensation_vector(read_flux_ring(num_sensors))
+
 # ------------------------------
 # MAIN TEST LOOP
 # ------------------------------
 
 if __name__ == "__main__":
+    import sys
+
+    # Optional: replay a recorded capture instead of the mock sensor
+    if len(sys.argv) > 1:
+        from .sensor_recording import SensorReplay
+        read_flux_ring = SensorReplay(sys.argv[1]).read_flux_ring
+
     for cycle in range(5):
         flux_ring = read_flux_ring()
         avg_field, field_variation = compute_field_symmetry(flux_ring)
@@ -16,7 +16,9 @@ Based on real-world concepts:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import decimate, finish_figure
+from .waveform_cache import sine_wave, time_base
 
 # ------------------------------
 # CONFIGURATION
@@ -28,28 +30,30 @@ SAMPLE_RATE = 20000
 FREQ = 3690  # Hz — Tesla harmonic
 
 def simulate_flux_ring(freq, duration, sample_rate, nodes):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+    t = time_base(duration, sample_rate)
     ring = np.zeros((nodes, len(t)))
 
     for i in range(nodes):
         phase_shift = (2 * np.pi * i) / nodes
-        ring[i] = np.sin(2 * np.pi * freq * t + phase_shift)
+        ring[i] = sine_wave(freq, duration, sample_rate, phase_shift)
 
     feedback = np.mean(ring, axis=0)
     return t, ring, feedback
 
-def plot_flux_ring(t, ring, feedback):
+def plot_flux_ring(t, ring, feedback, save_path=None):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 5))
     for i, wave in enumerate(ring):
-        plt.plot(t * 1000, wave, label=f'Node {i+1}')
-    plt.plot(t * 1000, feedback, 'k--', label='Flux Ring Output', linewidth=2)
+        plt.plot(*decimate(t * 1000, wave), label=f'Node {i+1}')
+    plt.plot(*decimate(t * 1000, feedback), 'k--', label='Flux Ring Output', linewidth=2)
     plt.title("Flux-Linked Feedback Ring — Tesla 3-6-9 Core")
     plt.xlabel("Time (ms)")
     plt.ylabel("Field Amplitude")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
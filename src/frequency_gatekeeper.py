@@ -13,15 +13,31 @@ the central field logic system. Protects against:
 
 Acts like a frequency firewall.
 
+Two operating modes:
+- "stream"     : causal block-by-block filtering; second-order
+                 sections are designed once and the filter state is
+                 carried between blocks, across any number of channels
+- "zero_phase" : the original offline two-pass response
+
+HarmonicFilterBank gates the whole Tesla series (n × base for
+n ∈ 3, 6, 9, 18, 27) in one FFT overlap-save pass: one forward
+transform per block is shared by every band.
+
+scipy is imported when a filter is first designed or run, so the
+waveform helpers load with numpy alone.
+
 Analogous real-world systems:
 - Bandpass filter (RF and audio)
 - EMI shielding protocols
 - Tesla selective resonance tuning
 """
 
+from functools import lru_cache
+
 import numpy as np
-import scipy.signal as signal
-import matplotlib.pyplot as plt
+
+from .plot_rendering import decimate, finish_figure
+from .waveform_cache import sine_wave, time_base
 
 # ------------------------------
 # CONFIGURATION
@@ -31,36 +47,168 @@ TARGET_FREQ = 3330  # Hz
 BANDWIDTH = 60  # Hz around the target
 SAMPLE_RATE = 192000
 DURATION = 0.01
+FILTER_ORDER = 4
+GATE_MODES = ("stream", "zero_phase")
+
+HARMONIC_SERIES = (3, 6, 9, 18, 27)                           # Control-loop doc series
+HARMONIC_CENTERS = tuple(n * TARGET_FREQ / 3 for n in HARMONIC_SERIES)
+BANK_TAPS = 2047                   # Linear-phase FIR length per band
+BANK_BLOCK = 8192                  # Samples per overlap-save block
 
 def generate_mixed_signal():
-    t = np.linspace(0, DURATION, int(SAMPLE_RATE * DURATION), endpoint=False)
-    wave_clean = np.sin(2 * np.pi * TARGET_FREQ * t)
-    wave_noise = 0.4 * np.sin(2 * np.pi * 3600 * t)  # interference
-    wave_noise += 0.3 * np.sin(2 * np.pi * 3150 * t)  # interference
+    t = time_base(DURATION, SAMPLE_RATE)
+    wave_clean = sine_wave(TARGET_FREQ, DURATION, SAMPLE_RATE)
+    wave_noise = 0.4 * sine_wave(3600, DURATION, SAMPLE_RATE)  # interference
+    wave_noise += 0.3 * sine_wave(3150, DURATION, SAMPLE_RATE)  # interference
     return t, wave_clean + wave_noise
 
 def bandpass_filter(signal_in, target_freq, bandwidth, sample_rate):
+    from scipy import signal
+
     nyq = 0.5 * sample_rate
     low = (target_freq - bandwidth) / nyq
     high = (target_freq + bandwidth) / nyq
     b, a = signal.butter(4, [low, high], btype='band')
     return signal.filtfilt(b, a, signal_in)
 
+# ------------------------------
+# STREAMING GATEKEEPER
+# ------------------------------
+
+@lru_cache(maxsize=64)
+def design_bandpass_sos(target_freq, bandwidth, sample_rate, order=FILTER_ORDER):
+    from scipy import signal
+
+    nyq = 0.5 * sample_rate
+    low = (target_freq - bandwidth) / nyq
+    high = (target_freq + bandwidth) / nyq
+    return signal.butter(order, [low, high], btype='band', output='sos')
+
+class StreamingGatekeeper:
+    """
+    Bandpass gate that filters a live stream block by block.
+    Blocks may hold many channels; time runs along `axis`.
+    """
+
+    def __init__(self, target_freq=TARGET_FREQ, bandwidth=BANDWIDTH, sample_rate=SAMPLE_RATE,
+                 axis=-1, mode="stream", order=FILTER_ORDER):
+        if mode not in GATE_MODES:
+            raise ValueError(f"unknown mode {mode!r}, expected one of {GATE_MODES}")
+        self.sos = design_bandpass_sos(target_freq, bandwidth, sample_rate, order)
+        self.axis = axis
+        self.mode = mode
+        self._zi = None
+
+    def process(self, block):
+        from scipy import signal
+
+        block = np.asarray(block, dtype=np.float64)
+        if self.mode == "zero_phase":
+            return signal.sosfiltfilt(self.sos, block, axis=self.axis)
+
+        if self._zi is None:
+            self._zi = np.zeros(self._state_shape(block))
+        elif self._zi.shape != self._state_shape(block):
+            raise ValueError(f"block shape {block.shape} does not match the channel layout of the stream")
+
+        filtered, self._zi = signal.sosfilt(self.sos, block, axis=self.axis, zi=self._zi)
+        return filtered
+
+    def reset(self):
+        self._zi = None
+
+    def _state_shape(self, block):
+        shape = list(block.shape)
+        shape[self.axis] = 2
+        return (self.sos.shape[0],) + tuple(shape)
+
+# ------------------------------
+# HARMONIC FILTER BANK
+# ------------------------------
+
+class HarmonicFilterBank:
+    """
+    Splits (..., samples) input into (..., bands, samples) harmonic
+    bands with FFT overlap-save. Stateful: consecutive calls continue
+    the same stream. Output lags input by `delay` samples (linear-phase FIR).
+    """
+
+    def __init__(self, centers=HARMONIC_CENTERS, bandwidth=BANDWIDTH, sample_rate=SAMPLE_RATE,
+                 numtaps=BANK_TAPS, block_size=BANK_BLOCK, dtype=np.float64, workers=None):
+        from scipy import fft as sp_fft, signal
+
+        self.centers = tuple(centers)
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.dtype = np.dtype(dtype)
+        self.workers = workers
+        self.taps = np.stack([
+            signal.firwin(numtaps, [fc - bandwidth, fc + bandwidth], pass_zero=False, fs=sample_rate)
+            for fc in self.centers
+        ])
+        self.delay = (numtaps - 1) // 2
+        self.nfft = 1 << int(np.ceil(np.log2(block_size + numtaps - 1)))
+        self._spectra = sp_fft.rfft(self.taps.astype(self.dtype), n=self.nfft)
+        self._history = None
+        self.energy = None
+
+    def process(self, block):
+        """
+        Returns (bands_out, block_energy): bands_out has shape
+        block.shape[:-1] + (bands, samples); block_energy sums the
+        squared band output over this block.
+        """
+        from scipy import fft as sp_fft
+
+        block = np.asarray(block, dtype=self.dtype)
+        overlap = self.taps.shape[1] - 1
+        lead = block.shape[:-1]
+        if self._history is None:
+            self._history = np.zeros(lead + (overlap,), dtype=self.dtype)
+            self.energy = np.zeros(lead + (len(self.centers),))
+        elif self._history.shape[:-1] != lead:
+            raise ValueError(f"block shape {block.shape} does not match the channel layout of the stream")
+
+        samples = block.shape[-1]
+        out = np.empty(lead + (len(self.centers), samples), dtype=self.dtype)
+        for start in range(0, samples, self.block_size):
+            chunk = block[..., start:start + self.block_size]
+            span = np.concatenate([self._history, chunk], axis=-1)
+            spectrum = sp_fft.rfft(span, n=self.nfft, workers=self.workers)
+            spectrum = spectrum[..., None, :] * self._spectra
+            bands = sp_fft.irfft(spectrum, n=self.nfft, workers=self.workers)
+            out[..., start:start + chunk.shape[-1]] = bands[..., overlap:span.shape[-1]]
+            self._history = span[..., -overlap:]
+
+        block_energy = np.einsum("...i,...i->...", out, out, dtype=np.float64)
+        self.energy += block_energy
+        return out, block_energy
+
+    def reset(self):
+        self._history = None
+        self.energy = None
+
+def split_harmonic_bands(signal_in, centers=HARMONIC_CENTERS, bandwidth=BANDWIDTH, sample_rate=SAMPLE_RATE):
+    bank = HarmonicFilterBank(centers, bandwidth, sample_rate)
+    return bank.process(signal_in)
+
 # ------------------------------
 # VISUALIZATION
 # ------------------------------
 
-def plot_filter_response(t, original, filtered):
+def plot_filter_response(t, original, filtered, save_path=None):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, original, label="Incoming Signal (With Noise)", alpha=0.5)
-    plt.plot(t * 1000, filtered, label="Filtered Signal", color='green')
+    plt.plot(*decimate(t * 1000, original), label="Incoming Signal (With Noise)", alpha=0.5)
+    plt.plot(*decimate(t * 1000, filtered), label="Filtered Signal", color='green')
     plt.title("Frequency Gatekeeper — Bandpass Filter Response")
     plt.xlabel("Time (ms)")
     plt.ylabel("Amplitude")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
@@ -19,7 +19,10 @@ Compatible With:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import decimate, finish_figure
+from .recursive_oscillator import harmonic_stack
+from .waveform_cache import time_base
 
 # ------------------------------
 # CONFIGURATION
@@ -31,13 +34,9 @@ DURATION = 0.01               # 10ms
 SAMPLE_RATE = 192000
 AMPLITUDE = 1.0
 
-def generate_harmonic_pattern(base, harmonics, duration, sample_rate):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    beam = np.zeros_like(t)
-
-    for h in harmonics:
-        f = base * h
-        beam += np.sin(2 * np.pi * f * t)
+def generate_harmonic_pattern(base, harmonics, duration, sample_rate, backend="sin"):
+    t = time_base(duration, sample_rate)
+    beam = harmonic_stack(base, harmonics, 1.0, 0.0, t, backend=backend, sample_rate=sample_rate)
 
     beam /= len(harmonics)
     return t, beam
@@ -55,19 +54,28 @@ def apply_surface_modulation(signal, spatial_factor=0.4):
     return signal * mod_curve
 
 # ------------------------------
-# MAIN EXECUTION
+# VISUALIZATION
 # ------------------------------
 
-if __name__ == "__main__":
-    t, base_beam = generate_harmonic_pattern(BASE_FREQ, HARMONICS, DURATION, SAMPLE_RATE)
-    modulated_beam = apply_surface_modulation(base_beam)
+def plot_lithography_pulse(t, modulated_beam, save_path=None):
+    import matplotlib.pyplot as plt
 
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, modulated_beam, label="Lithographic Field Pulse", color="purple")
+    plt.plot(*decimate(t * 1000, modulated_beam), label="Lithographic Field Pulse", color="purple")
     plt.title("Harmonic Lithography Pattern — Tesla 3-6-9 Beam Imprint")
     plt.xlabel("Time (ms)")
     plt.ylabel("Field Strength")
     plt.grid(True)
     plt.tight_layout()
     plt.legend()
-    plt.show()
+    return finish_figure(save_path)
+
+# ------------------------------
+# MAIN EXECUTION
+# ------------------------------
+
+if __name__ == "__main__":
+    t, base_beam = generate_harmonic_pattern(BASE_FREQ, HARMONICS, DURATION, SAMPLE_RATE)
+    modulated_beam = apply_surface_modulation(base_beam)
+
+    plot_lithography_pulse(t, modulated_beam)
@@ -0,0 +1,92 @@
+# import_benchmark.py
+# Cold-start import cost per module — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+Imports each ixag module in a fresh interpreter and records:
+
+- import time (best of `runs`, interpreter start-up excluded)
+- which heavy libraries (HEAVY_LIBS) the import dragged in
+
+numpy is imported before the clock starts, so the figure is the
+module's own cost on top of the numpy baseline every worker pays
+anyway. Results can be written as JSON to track regressions, and
+--max-ms turns the run into a gate (exit status 1 when any module
+is slower or loads a heavy library).
+
+    python -m ixag.import_benchmark --json import_times.json --max-ms 50
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# ------------------------------
+# CONFIGURATION
+# ------------------------------
+
+RUNS = 5
+HEAVY_LIBS = ("matplotlib", "scipy")
+
+_PROBE = """
+import importlib, json, sys, time
+import numpy
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "heavy": [m for m in sys.argv[2:] if m in sys.modules]}))
+"""
+
+# ------------------------------
+# MEASUREMENT
+# ------------------------------
+
+def measure_import(module, runs=RUNS, python=sys.executable):
+    """
+    Returns {"module", "ms", "heavy"} for `ixag.<module>`
+    """
+    best = None
+    for _ in range(runs):
+        proc = subprocess.run([python, "-c", _PROBE, f"{__package__}.{module}", *HEAVY_LIBS],
+                              capture_output=True, text=True, check=True)
+        result = json.loads(proc.stdout)
+        if best is None or result["seconds"] < best["seconds"]:
+            best = result
+    return {"module": module, "ms": best["seconds"] * 1e3, "heavy": best["heavy"]}
+
+def benchmark_imports(modules=None, runs=RUNS):
+    from . import MODULES
+
+    return [measure_import(module, runs) for module in (modules or MODULES)]
+
+def format_report(results):
+    lines = [f"{'module':<30}{'import (ms)':>12}  heavy"]
+    for r in sorted(results, key=lambda r: -r["ms"]):
+        lines.append(f"{r['module']:<30}{r['ms']:>12.1f}  {', '.join(r['heavy']) or '-'}")
+    return "\n".join(lines)
+
+# ------------------------------
+# MAIN EXECUTION
+# ------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-module cold-start import benchmark")
+    parser.add_argument("modules", nargs="*", help="modules to time (default: all)")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    parser.add_argument("--json", help="write results to this path")
+    parser.add_argument("--max-ms", type=float, help="fail if any module is slower or loads a heavy library")
+    args = parser.parse_args()
+
+    results = benchmark_imports(args.modules, args.runs)
+    print(format_report(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.max_ms is not None:
+        failed = [r["module"] for r in results if r["ms"] > args.max_ms or r["heavy"]]
+        if failed:
+            print(f"Over budget: {', '.join(failed)}")
+            sys.exit(1)
@@ -21,6 +21,8 @@ Intended for use with:
 
 import numpy as np
 
+IMU_FRAME_WIDTH = 6  # ax, ay, az, gx, gy, gz
+
 # ------------------------------
 # SENSOR MOCKUP (Replace with real IMU driver)
 # ------------------------------
@@ -31,18 +33,56 @@ def read_imu():
     gyro  = np.random.normal(0, 0.01, 3)  # Simulated angular velocity (rad/s)
     return accel, gyro
 
+def read_imu_batch(frames):
+    # Block of consecutive IMU frames: (frames, 6) = accel | gyro
+    batch = np.empty((frames, IMU_FRAME_WIDTH))
+    batch[:, :3] = np.random.normal(0, 0.02, (frames, 3))
+    batch[:, 3:] = np.random.normal(0, 0.01, (frames, 3))
+    return batch
+
 # ------------------------------
 # VECTOR PROCESSING
 # ------------------------------
+# Axes run along the last dimension: one vector (3,) or a batch (N, 3)
 
 def compute_magnitude(vec):
-    return np.sqrt(np.sum(np.square(vec)))
+    return np.sqrt(np.sum(np.square(vec), axis=-1))
 
 def direction_unit(vec):
-    norm = np.linalg.norm(vec)
-    if norm == 0:
-        return np.zeros_like(vec)
-    return vec / norm
+    vec = np.asarray(vec, dtype=np.float64)
+    norm = np.linalg.norm(vec, axis=-1, keepdims=True)
+    return np.divide(vec, norm, out=np.zeros_like(vec), where=norm != 0)
+
+def _scale_rows(vectors, scaled, peak):
+    # hypot-style: divide each row by its largest |component| so squaring
+    # neither overflows (~1e200) nor drops into subnormals (~1e-160)
+    np.abs(vectors, out=scaled)
+    np.max(scaled, axis=1, out=peak)
+    np.divide(vectors, peak[:, None], out=scaled, where=peak[:, None] > 0)  # zero rows stay |0| = 0
+    return scaled, peak
+
+def _float_rows(vectors):
+    vectors = np.asarray(vectors)
+    return vectors if np.issubdtype(vectors.dtype, np.floating) else vectors.astype(np.float64)
+
+def compute_magnitude_batch(vectors, out=None, scratch=None):
+    """
+    Row norms of (N, 3) accel or gyro samples. Pass out (N,) and
+    scratch (N, 3) buffers (or larger ones) to skip all allocations.
+    """
+    vectors = _float_rows(vectors)
+    n = len(vectors)
+    out = np.empty(n, dtype=vectors.dtype) if out is None else out[:n]
+    scaled = np.empty_like(vectors) if scratch is None else scratch[:n]
+
+    _scale_rows(vectors, scaled, out)  # out holds the row peaks
+    np.square(scaled, out=scaled)
+    squares = scaled[:, 0]
+    squares += scaled[:, 1]
+    squares += scaled[:, 2]
+    np.sqrt(squares, out=squares)
+    out *= squares
+    return out
 
 # ------------------------------
 # FIELD COMPENSATION LOGIC
@@ -57,11 +97,48 @@ def compute_counter_field(accel_vector):
     dir_vec = direction_unit(accel_vector)
     return -1 * dir_vec  # Invert vector to oppose motion
 
+def compute_counter_field_batch(accel, out=None, magnitude_out=None, scratch=None):
+    """
+    Magnitudes and opposing unit vectors for (N, 3) accel samples in one pass.
+    Rows are scaled by their largest component first, so huge, tiny and
+    integer samples behave like compute_counter_field; zero vectors map
+    to a zero counter field. Pass out (N, 3), magnitude_out (N,) and
+    scratch (N,) buffers (or larger ones) to skip the big allocations.
+    Returns (magnitudes, counter_fields).
+    """
+    accel = _float_rows(accel)
+    n = len(accel)
+    counter = np.empty((n, 3)) if out is None else out[:n]
+    magnitudes = np.empty(n) if magnitude_out is None else magnitude_out[:n]
+    peak = np.empty(n) if scratch is None else scratch[:n]
+
+    _scale_rows(accel, counter, peak)
+    np.einsum("ij,ij->i", counter, counter, out=magnitudes)
+    np.sqrt(magnitudes, out=magnitudes)  # in [1, √3], or 0 for zero rows
+    np.divide(counter, magnitudes[:, None], out=counter, where=magnitudes[:, None] > 0)
+    np.negative(counter, out=counter)
+    magnitudes *= peak
+    return magnitudes, counter
+
+def inertia_cancel_step():
+    """
+    One control cycle: read the IMU, return the counter-field direction
+    """
+    accel, _ = read_imu()
+    return compute_counter_field(accel)
+
 # ------------------------------
 # MAIN EXECUTION LOOP (Test)
 # ------------------------------
 
 if __name__ == "__main__":
+    import sys
+
+    # Optional: replay a recorded capture instead of the mock sensor
+    if len(sys.argv) > 1:
+        from .sensor_recording import SensorReplay
+        read_imu = SensorReplay(sys.argv[1]).read_imu
+
     for step in range(10):  # Simulate 10 cycles
         accel, gyro = read_imu()
         net_accel_mag = compute_magnitude(accel)
@@ -17,7 +17,9 @@ Inspired by:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .phased_array_engine import synthesize_phased_array, time_base
+from .plot_rendering import decimate, finish_figure
 
 # ------------------------------
 # CONFIGURATION
@@ -33,38 +35,37 @@ PHASE_NULL = np.pi  # 180° cancellation
 # MATRIX GENERATION
 # ------------------------------
 
-def generate_dampening_matrix(grid_size, freq, duration, sample_rate, phase_shift):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    matrix = []
-
-    for i in range(grid_size):
-        row = []
-        for j in range(grid_size):
-            phase = phase_shift * ((i + j) % 2)  # alternating cancel fields
-            wave = np.sin(2 * np.pi * freq * t + phase)
-            row.append(wave)
-        matrix.append(row)
+def generate_dampening_phases(grid_size, phase_shift):
+    rows, cols = (grid_size, grid_size) if np.isscalar(grid_size) else grid_size
+    checker = (np.arange(rows)[:, None] + np.arange(cols)[None, :]) % 2
+    return phase_shift * checker  # alternating cancel fields
 
-    return np.array(matrix), t
+def generate_dampening_matrix(grid_size, freq, duration, sample_rate, phase_shift, dtype=np.float64, out=None):
+    t = time_base(duration, sample_rate)
+    phases = generate_dampening_phases(grid_size, phase_shift)
+    matrix = synthesize_phased_array(phases, freq, t, dtype=dtype, out=out)
+    return matrix, t
 
 # ------------------------------
 # VISUALIZATION
 # ------------------------------
 
-def plot_matrix_slice(matrix, t):
+def plot_matrix_slice(matrix, t, save_path=None):
+    import matplotlib.pyplot as plt
+
     center_wave = matrix[GRID_SIZE//2][GRID_SIZE//2]
     edge_wave = matrix[0][0]
 
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, center_wave, label="Center Pulse")
-    plt.plot(t * 1000, edge_wave, label="Edge Pulse", linestyle='--')
+    plt.plot(*decimate(t * 1000, center_wave), label="Center Pulse")
+    plt.plot(*decimate(t * 1000, edge_wave), label="Edge Pulse", linestyle='--')
     plt.title("Inertial Dampening Pulse — Phase Cancel Matrix")
     plt.xlabel("Time (ms)")
     plt.ylabel("Field Strength")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
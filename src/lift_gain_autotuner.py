@@ -0,0 +1,179 @@
+# lift_gain_autotuner.py
+# Parallel PID gain auto-tuning for the dynamic lift loop — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+Searches (GAIN_P, GAIN_I, GAIN_D) for the dynamic lift feedback loop
+instead of tuning by hand.
+
+Search strategy:
+- Stage 0: uniform grid over GAIN_BOUNDS
+- Stage 1..n: local grids around the TOP_K best candidates, shrinking
+  the span each stage
+
+Each candidate is scored on REALIZATIONS noisy runs of the batched
+lift simulator. Candidates are split into fixed chunks that a process
+pool evaluates. Every chunk draws its noise from
+SeedSequence(seed, spawn_key=(stage, chunk)), so results do not depend
+on worker count or completion order.
+
+With a checkpoint path, per-chunk costs are saved atomically as they
+finish. Rerunning with the same configuration skips every chunk
+that is already done.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .dynamic_lift_feedback import DURATION, SAMPLE_RATE, SETPOINT, simulate_lift_feedback_batch, summarize_response
+
+# ------------------------------
+# CONFIGURATION
+# ------------------------------
+
+GAIN_BOUNDS = ((0.0, 6.0), (0.0, 2.0), (0.0, 4.0))   # P, I, D search box
+GRID_POINTS = 24                  # Points per axis in the coarse grid (24³ = 13824)
+REFINE_POINTS = 7                 # Points per axis around each refined candidate
+REFINE_STAGES = 3
+REFINE_SHRINK = 0.5               # Local search half-width multiplier per stage
+TOP_K = 8
+REALIZATIONS = 4                  # Noise draws per candidate
+CHUNK_SIZE = 512                  # Candidates per pool task
+
+COST_WEIGHTS = {"ise": 1.0, "overshoot": 2.0, "settling": 0.5, "steady_state": 4.0}
+
+# ------------------------------
+# COST
+# ------------------------------
+
+def response_cost(t, outputs, setpoint=SETPOINT):
+    """
+    Scalar cost per trajectory (lower is better). Trajectories that
+    never settle pay the full window length as settling time.
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        metrics = summarize_response(t, outputs, setpoint)
+        ise = np.mean((setpoint - outputs) ** 2, axis=1)
+        settling = np.where(np.isfinite(metrics["settling_time"]), metrics["settling_time"], t[-1])
+        cost = (COST_WEIGHTS["ise"] * ise
+                + COST_WEIGHTS["overshoot"] * metrics["overshoot"]
+                + COST_WEIGHTS["settling"] * settling / t[-1]
+                + COST_WEIGHTS["steady_state"] * metrics["steady_state_error"])
+    return np.where(np.isfinite(cost), cost, np.inf)
+
+def evaluate_chunk(stage, chunk, gains, seed, realizations=REALIZATIONS,
+                   duration=DURATION, sample_rate=SAMPLE_RATE):
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(stage, chunk)))
+    repeated = np.repeat(gains, realizations, axis=0)
+    with np.errstate(over="ignore", invalid="ignore"):
+        t, outputs = simulate_lift_feedback_batch(repeated[:, 0], repeated[:, 1], repeated[:, 2],
+                                                  duration=duration, sample_rate=sample_rate, rng=rng)
+    costs = response_cost(t, outputs)
+    return stage, chunk, costs.reshape(-1, realizations).mean(axis=1)
+
+# ------------------------------
+# CANDIDATE GENERATION
+# ------------------------------
+
+def grid_candidates(bounds, points):
+    axes = [np.linspace(lo, hi, points) for lo, hi in bounds]
+    return np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, len(bounds))
+
+def refine_candidates(centers, spans, bounds, points):
+    offsets = grid_candidates([(-s, s) for s in spans], points)
+    candidates = (centers[:, None, :] + offsets[None, :, :]).reshape(-1, len(bounds))
+    lows, highs = np.array(bounds).T
+    candidates = np.clip(candidates, lows, highs)
+    return np.unique(candidates, axis=0)
+
+# ------------------------------
+# CHECKPOINTING
+# ------------------------------
+
+def _load_checkpoint(path, config):
+    if path is None or not os.path.exists(path):
+        return {}
+    with np.load(path, allow_pickle=False) as data:
+        if json.loads(str(data["config"])) != config:
+            raise ValueError(f"checkpoint {path} was written with a different configuration")
+        return {int(k.split("_")[1]): (data[k], data[f"costs_{k.split('_')[1]}"])
+                for k in data.files if k.startswith("candidates_")}
+
+def _save_checkpoint(path, config, stages):
+    arrays = {"config": np.array(json.dumps(config))}
+    for stage, (candidates, costs) in stages.items():
+        arrays[f"candidates_{stage}"] = candidates
+        arrays[f"costs_{stage}"] = costs
+    tmp = f"{path}.tmp.npz"
+    np.savez(tmp, **arrays)
+    os.replace(tmp, path)
+
+# ------------------------------
+# AUTO-TUNER
+# ------------------------------
+
+def autotune_gains(bounds=GAIN_BOUNDS, grid_points=GRID_POINTS, refine_stages=REFINE_STAGES,
+                   refine_points=REFINE_POINTS, top_k=TOP_K, realizations=REALIZATIONS,
+                   chunk_size=CHUNK_SIZE, workers=None, seed=0, checkpoint=None):
+    """
+    Returns (best_gains, best_cost, stages) where stages maps the
+    stage index to its (candidates, costs) arrays.
+    """
+    config = {
+        "bounds": [list(map(float, b)) for b in bounds], "grid_points": grid_points,
+        "refine_stages": refine_stages, "refine_points": refine_points, "top_k": top_k,
+        "realizations": realizations, "chunk_size": chunk_size, "seed": seed,
+    }
+    stages = _load_checkpoint(checkpoint, config)
+
+    spans = np.array([(hi - lo) / (grid_points - 1) for lo, hi in bounds])
+    candidates = grid_candidates(bounds, grid_points)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for stage in range(refine_stages + 1):
+            if stage > 0:
+                prev_candidates, prev_costs = stages[stage - 1]
+                best = prev_candidates[np.argsort(prev_costs)[:top_k]]
+                candidates = refine_candidates(best, spans, bounds, refine_points)
+                spans = spans * REFINE_SHRINK
+
+            if stage in stages and np.array_equal(stages[stage][0], candidates):
+                costs = stages[stage][1]
+            else:
+                costs = np.full(len(candidates), np.nan)
+            stages[stage] = (candidates, costs)
+
+            pending = []
+            for chunk, start in enumerate(range(0, len(candidates), chunk_size)):
+                if np.isnan(costs[start:start + chunk_size]).any():
+                    pending.append(pool.submit(evaluate_chunk, stage, chunk,
+                                               candidates[start:start + chunk_size], seed, realizations))
+
+            for future in as_completed(pending):
+                _, chunk, chunk_costs = future.result()
+                start = chunk * chunk_size
+                costs[start:start + len(chunk_costs)] = chunk_costs
+                if checkpoint is not None:
+                    _save_checkpoint(checkpoint, config, stages)
+
+    final_candidates, final_costs = stages[refine_stages]
+    best = int(np.argmin(final_costs))
+    return final_candidates[best], final_costs[best], stages
+
+# ------------------------------
+# MAIN EXECUTION
+# ------------------------------
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    gains, cost, stages = autotune_gains(grid_points=10, refine_stages=2)
+    evaluated = sum(len(c) for c, _ in stages.values())
+
+    print(f"Evaluated {evaluated} candidates in {time.perf_counter() - start:.1f} s")
+    print(f"Best gains: P={gains[0]:.3f}  I={gains[1]:.3f}  D={gains[2]:.3f}  (cost {cost:.4f})")
@@ -18,7 +18,10 @@ Real-world references:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import decimate, finish_figure
+from .recursive_oscillator import as_harmonic_series, harmonic_stack
+from .waveform_cache import sine_wave, time_base
 
 # ------------------------------
 # CONFIGURATION
@@ -29,26 +32,32 @@ SAMPLE_RATE = 1_000_000
 FREQS = [3330, 6660, 9990]  # Tesla harmonic set
 AMPLITUDES = [1.0, 0.6, 0.4]
 
-def generate_longitudinal_pulse(freqs, amps, duration, sample_rate):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    signal = np.zeros_like(t)
+def generate_longitudinal_pulse(freqs, amps, duration, sample_rate, backend="sin"):
+    t = time_base(duration, sample_rate)
 
-    for f, a in zip(freqs, amps):
-        signal += a * np.sin(2 * np.pi * f * t)
+    if backend == "sin":
+        signal = np.zeros_like(t)
+        for f, a in zip(freqs, amps):
+            signal += a * sine_wave(f, duration, sample_rate)
+    else:
+        base, multipliers = as_harmonic_series(freqs)
+        signal = harmonic_stack(base, multipliers, amps, 0.0, t, backend=backend, sample_rate=sample_rate)
 
     envelope = np.exp(-((t - duration / 2)**2) / (2 * (duration / 10)**2))
     longitudinal_wave = signal * envelope
     return t, longitudinal_wave
 
-def plot_pulse(t, wave):
+def plot_pulse(t, wave, save_path=None):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, wave, color='orange')
+    plt.plot(*decimate(t * 1000, wave), color='orange')
     plt.title("Tesla Longitudinal Harmonic Pulse — 3-6-9 Stack")
     plt.xlabel("Time (ms)")
     plt.ylabel("Amplitude")
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
@@ -19,7 +19,10 @@ Real-world analogues:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import finish_figure, grid_stride, stride_grid
+from .radial_profile import RadialGrid
+from .tiled_field import TILE_CELLS, evaluate_tiled, field_outputs
 
 # ------------------------------
 # SIMULATION CONFIG
@@ -30,19 +33,119 @@ RADIUS = 0.35
 PLASMA_DENSITY = 1.0
 EDGE_FADE = 0.08
 INTENSITY = 4.0
+PROFILE_STEP = 1e-5  # radial table spacing — smooth torus, error ~1e-8
+VOLUME_RESOLUTION = 512   # Voxels per side of the 3D torus volume
+ISO_THRESHOLD = 1.0       # Intensity counted as inside the cocoon shell
+
+def cocoon_profile(dist, radius=RADIUS, edge_fade=EDGE_FADE, intensity=INTENSITY):
+    return intensity * np.exp(-((dist - radius)**2) / (2 * edge_fade**2))
+
+def cocoon_intensity(X, Y):
+    return cocoon_profile(np.sqrt(X**2 + Y**2))
 
 def generate_cocoon_field():
     x = np.linspace(-1, 1, RESOLUTION)
     y = np.linspace(-1, 1, RESOLUTION)
     X, Y = np.meshgrid(x, y)
-    dist = np.sqrt(X**2 + Y**2)
 
-    field = INTENSITY * np.exp(-((dist - RADIUS)**2) / (2 * EDGE_FADE**2))
+    field = cocoon_intensity(X, Y)
     return X, Y, field
 
-def plot_cocoon(X, Y, field):
+def generate_cocoon_field_tiled(resolution=RESOLUTION, directory=None, dtype=np.float64, tile_cells=TILE_CELLS):
+    """
+    Out-of-core generate_cocoon_field: returns the x, y axes and the
+    intensity map, written band by band
+    """
+    x = np.linspace(-1, 1, resolution)
+    y = np.linspace(-1, 1, resolution)
+    maps = evaluate_tiled(cocoon_intensity, ("field",), x, y, dtype, directory, tile_cells=tile_cells)
+    return x, y, maps["field"]
+
+def cocoon_radial_grid(resolution=RESOLUTION, step=PROFILE_STEP):
+    x = np.linspace(-1, 1, resolution)
+    y = np.linspace(-1, 1, resolution)
+    return RadialGrid(x, y, (0.0, 0.0), step)
+
+def generate_cocoon_field_radial(resolution=RESOLUTION, radius=RADIUS, edge_fade=EDGE_FADE, intensity=INTENSITY,
+                                 step=PROFILE_STEP, out=None, grid=None):
+    """
+    Cocoon map through the radial fast path: returns the x, y axes and
+    the intensity, interpolated from a 1-D table. Pass
+    grid=cocoon_radial_grid(...) to reuse one index map across frames.
+    """
+    grid = cocoon_radial_grid(resolution, step) if grid is None else grid
+    return grid.x, grid.y, grid.evaluate(lambda r: cocoon_profile(r, radius, edge_fade, intensity), out)
+
+# ------------------------------
+# VOLUMETRIC TORUS
+# ------------------------------
+# The 3D torus intensity separates:
+#     I·exp(-((ρ - R)² + z²) / 2f²) = ring(ρ) · I·exp(-z² / 2f²)
+# so every z-slab is one 2D ring map scaled per plane.
+
+def _torus_factors(resolution, radius, edge_fade, intensity):
+    axis = np.linspace(-1, 1, resolution)
+    ring = cocoon_profile(np.sqrt(axis[None, :]**2 + axis[:, None]**2), radius, edge_fade, 1.0)
+    height = cocoon_profile(np.abs(axis), 0.0, edge_fade, intensity)
+    return axis, ring, height
+
+def generate_cocoon_volume(resolution=VOLUME_RESOLUTION, threshold=ISO_THRESHOLD, radius=RADIUS,
+                           edge_fade=EDGE_FADE, intensity=INTENSITY, directory=None, dtype=np.float32,
+                           slab_cells=TILE_CELLS):
+    """
+    Full (z, y, x) torus volume over [-1, 1]³, written slab by slab (to
+    cocoon.npy as a memmap when `directory` is given), so RAM holds one
+    ring map and one slab. The same pass counts voxels above
+    `threshold` and integrates intensity (× voxel volume) per z-plane,
+    both from the values as stored in `dtype`.
+    Returns the axis, the volume, per-plane iso counts and integrals.
+    """
+    axis, ring, height = _torus_factors(resolution, radius, edge_fade, intensity)
+    shape = (resolution,) * 3
+    volume = field_outputs(("cocoon",), shape, dtype, directory)["cocoon"]
+    iso_count = np.empty(resolution, dtype=np.int64)
+    integral = np.empty(resolution)
+    voxel = (axis[1] - axis[0]) ** 3
+
+    planes = max(1, slab_cells // ring.size)
+    for z0 in range(0, resolution, planes):
+        z1 = min(z0 + planes, resolution)
+        slab = (height[z0:z1, None, None] * ring).astype(dtype, copy=False)
+        volume[z0:z1] = slab
+        iso_count[z0:z1] = np.count_nonzero(slab > threshold, axis=(1, 2))
+        integral[z0:z1] = slab.sum(axis=(1, 2), dtype=np.float64) * voxel
+
+    if isinstance(volume, np.memmap):
+        volume.flush()
+    return axis, volume, iso_count, integral
+
+def cocoon_volume_stats(resolution=VOLUME_RESOLUTION, threshold=ISO_THRESHOLD, radius=RADIUS,
+                        edge_fade=EDGE_FADE, intensity=INTENSITY, dtype=np.float32):
+    """
+    Per-plane iso counts and integrals of generate_cocoon_volume without
+    building the volume: a plane is ring · height[z], and rounding to
+    `dtype` keeps it monotone in ring, so its count comes from a binary
+    search of one sorted ring (all planes at once). Counts match the
+    stored volume exactly; integrals to `dtype` precision.
+    """
+    axis, ring, height = _torus_factors(resolution, radius, edge_fade, intensity)
+    ranked = np.sort(ring, axis=None)
+    lo = np.zeros(resolution, dtype=np.int64)     # first ranked index above threshold
+    hi = np.full(resolution, ranked.size, dtype=np.int64)
+    while np.any(lo < hi):
+        mid = (lo + hi) // 2
+        above = (ranked[np.minimum(mid, ranked.size - 1)] * height).astype(dtype) > threshold
+        hi = np.where(above & (lo < hi), mid, hi)
+        lo = np.where(~above & (lo < hi), mid + 1, lo)
+    integral = height * ring.sum() * (axis[1] - axis[0]) ** 3
+    return axis, ranked.size - lo, integral
+
+def plot_cocoon(X, Y, field, save_path=None):
+    import matplotlib.pyplot as plt
+
+    s = grid_stride(field.shape)
     plt.figure(figsize=(6, 6))
-    cocoon = plt.contourf(X, Y, field, levels=80, cmap='plasma')
+    cocoon = plt.contourf(stride_grid(X, s), stride_grid(Y, s), field[::s, ::s], levels=80, cmap='plasma')
     plt.title("Plasma Cocoon Field Model")
     plt.xlabel("X (normalized)")
     plt.ylabel("Y (normalized)")
@@ -50,7 +153,7 @@ def plot_cocoon(X, Y, field):
     plt.grid(False)
     plt.axis("equal")
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
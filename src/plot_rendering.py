@@ -0,0 +1,194 @@
+# plot_rendering.py
+# Headless, decimated figure rendering for every module's plots — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+Shared rendering path for the plot_* functions.
+
+- finish_figure(save_path): shows the figure interactively, or writes
+  it (PNG / SVG / PDF by extension) and closes it when a path is given
+- decimate(x, y): reduces long signals to the plot's pixel budget
+  before they reach matplotlib
+    minmax : first / min / max / last of each bin, in time order, so
+             peaks and envelopes survive exactly (default, vectorized)
+    lttb   : Largest-Triangle-Three-Buckets, visually closest for
+             smooth traces (one small numpy step per output point)
+- grid_stride(shape): step that caps 2-D fields at PLOT_GRID cells a
+  side for contourf / imshow / quiver
+- render_many(jobs): renders figures in worker processes on the Agg
+  backend, so batch nodes never open a window
+
+A 1 MHz, 2 ms pulse is 2000 points either way; a 1 s capture at
+1 MHz goes from 10⁶ line vertices to PLOT_POINTS.
+
+matplotlib is imported on first render, so modules can import
+decimate / finish_figure without paying for it.
+"""
+
+import os
+
+import numpy as np
+
+# ------------------------------
+# CONFIGURATION
+# ------------------------------
+
+RENDER_DPI = 100
+PLOT_POINTS = 2000                # Points per series after decimation (~2 per pixel at 10 in × 100 dpi)
+PLOT_GRID = 400                   # Max cells per side of a plotted 2-D field
+DECIMATE_METHODS = ("minmax", "lttb")
+
+# ------------------------------
+# FIGURE OUTPUT
+# ------------------------------
+
+def use_headless():
+    """
+    Switches matplotlib to the non-interactive Agg backend
+    """
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+
+def finish_figure(save_path=None, fig=None):
+    """
+    Ends a plot_* function: plt.show() without a path, otherwise
+    saves the figure and closes it. Returns save_path.
+    """
+    import matplotlib.pyplot as plt
+
+    fig = plt.gcf() if fig is None else fig
+    if save_path is None:
+        plt.show()
+        return None
+    fig.savefig(save_path, dpi=RENDER_DPI)
+    plt.close(fig)
+    return save_path
+
+# ------------------------------
+# DECIMATION
+# ------------------------------
+
+def minmax_decimate(x, y, n_out=PLOT_POINTS):
+    """
+    Keeps first, min, max and last of each of n_out // 4 bins
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    bins = max(n_out // 4, 1)
+    width = len(y) // bins
+    if width < 4:
+        return x, y
+
+    body = y[:bins * width].reshape(bins, width)
+    base = np.arange(bins)[:, None] * width
+    picks = np.concatenate([
+        np.zeros((bins, 1), dtype=np.intp),
+        body.argmin(axis=1)[:, None],
+        body.argmax(axis=1)[:, None],
+        np.full((bins, 1), width - 1, dtype=np.intp),
+    ], axis=1)
+    picks.sort(axis=1)
+    idx = (picks + base).ravel()
+    if bins * width < len(y):
+        idx = np.append(idx, len(y) - 1)
+    return x[idx], y[idx]
+
+def lttb_decimate(x, y, n_out=PLOT_POINTS):
+    """
+    Largest-Triangle-Three-Buckets downsampling to n_out points
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0], idx[-1] = 0, n - 1
+    xf = x.astype(np.float64)
+    yf = y.astype(np.float64)
+
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nlo, nhi = hi, edges[b + 2] if b + 2 < n_out - 1 else n
+        avg_x = xf[nlo:nhi].mean()
+        avg_y = yf[nlo:nhi].mean()
+        ax, ay = xf[idx[b]], yf[idx[b]]
+        area = np.abs((ax - avg_x) * (yf[lo:hi] - ay) - (ax - xf[lo:hi]) * (avg_y - ay))
+        idx[b + 1] = lo + int(np.argmax(area))
+    return x[idx], y[idx]
+
+def decimate(x, y, n_out=PLOT_POINTS, method="minmax"):
+    """
+    (x, y) reduced to about n_out points for plotting
+    """
+    if method not in DECIMATE_METHODS:
+        raise ValueError(f"method must be one of {DECIMATE_METHODS}, got {method!r}")
+    if len(y) <= n_out:
+        return x, y
+    if method == "lttb":
+        return lttb_decimate(x, y, n_out)
+    return minmax_decimate(x, y, n_out)
+
+def grid_stride(shape, max_side=PLOT_GRID):
+    """
+    Row / column step that keeps a 2-D field within max_side cells a side
+    """
+    return max(1, -(-max(shape[:2]) // max_side))
+
+def stride_grid(a, step):
+    """
+    a[::step, ::step] for 2-D grids, a[::step] for the 1-D axes that
+    tiled generators return
+    """
+    return a[::step] if np.ndim(a) == 1 else a[::step, ::step]
+
+# ------------------------------
+# PARALLEL RENDERING
+# ------------------------------
+
+def _render_job(plot_func, args, kwargs, save_path):
+    plot_func(*args, save_path=save_path, **kwargs)
+    return save_path
+
+def render_many(jobs, workers=None):
+    """
+    Renders (plot_func, args, kwargs, save_path) jobs on a process
+    pool with the Agg backend. plot_func must be a module-level
+    plot_* function taking save_path. Returns the paths in job order.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=use_headless) as pool:
+        futures = [pool.submit(_render_job, func, args, kwargs or {}, path)
+                   for func, args, kwargs, path in jobs]
+        return [future.result() for future in futures]
+
+# ------------------------------
+# MAIN TEST
+# ------------------------------
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    from .longitudinal_pulse_harmonics import plot_pulse
+
+    use_headless()
+    t = np.arange(1_000_000) / 1_000_000
+    wave = np.sin(2 * np.pi * 3690 * t) * np.exp(-3 * t) + 0.05 * np.random.default_rng(0).standard_normal(t.size)
+
+    for method in DECIMATE_METHODS:
+        start = time.perf_counter()
+        xd, yd = decimate(t, wave, method=method)
+        print(f"{method:>6}: {len(t)} → {len(xd)} points in {(time.perf_counter() - start) * 1e3:.1f} ms, "
+              f"peak kept: {np.isclose(yd.max(), wave.max())}")
+
+    out_dir = tempfile.mkdtemp()
+    jobs = [(plot_pulse, (t, wave * (k + 1)), None, os.path.join(out_dir, f"pulse_{k}.png")) for k in range(8)]
+    start = time.perf_counter()
+    paths = render_many(jobs)
+    print(f"Rendered {len(paths)} figures in {time.perf_counter() - start:.2f} s → {out_dir}")
@@ -0,0 +1,158 @@
+# recursive_oscillator.py
+# Recursive-oscillator synthesis backends for harmonic stacks — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+Builds integer harmonic stacks without evaluating a transcendental
+per sample per harmonic.
+
+Backends:
+- "sin"    : reference path, one np.sin over the time base per harmonic
+- "phasor" : z_h = z_(h-1) * z_1 complex rotation from the fundamental
+
+The fundamental itself is produced by block rotation: one table of
+e^(iwk) for k < B and one of e^(iwBm) for the block starts, so a run
+of N samples costs roughly 2*sqrt(N) complex exponentials.
+
+Harmonic recursion accumulates rounding error roughly linearly with
+harmonic order, so the phasor backend renormalizes the running
+phasor back onto the unit circle every `renorm_every` harmonics.
+
+Run this file directly for an accuracy-vs-speed benchmark against
+the np.sin path at 192 kHz and 1 MHz.
+"""
+
+import numpy as np
+
+from .waveform_cache import sine_samples
+
+# ------------------------------
+# CONFIGURATION
+# ------------------------------
+
+BACKENDS = ("sin", "phasor")
+RENORM_EVERY = 4                  # Harmonic steps between unit-circle renormalizations
+
+# ------------------------------
+# HARMONIC SERIES HELPERS
+# ------------------------------
+
+def as_harmonic_series(freqs, rtol=1e-9):
+    """
+    Splits an explicit frequency list (e.g. [3330, 6660, 9990]) into
+    a fundamental and integer multipliers.
+    """
+    freqs = np.asarray(freqs, dtype=np.float64)
+    base = np.min(freqs)
+    ratios = freqs / base
+    multipliers = np.rint(ratios).astype(int)
+    if np.any(np.abs(ratios - multipliers) > rtol * ratios):
+        raise ValueError(f"frequencies {freqs.tolist()} are not integer multiples of {base}")
+    return base, multipliers.tolist()
+
+def fundamental_phasor(omega, n, start_phase=0.0, block=None):
+    """
+    Returns e^(i(start_phase + omega*k)) for k < n via block rotation
+    """
+    if block is None:
+        block = max(1, int(np.sqrt(n)))
+    starts = -(-n // block)
+    head = np.exp(1j * (start_phase + omega * block * np.arange(starts)))
+    tail = np.exp(1j * omega * np.arange(block))
+    return np.multiply.outer(head, tail).ravel()[:n]
+
+# ------------------------------
+# SYNTHESIS
+# ------------------------------
+
+def harmonic_stack(base_freq, multipliers, weights, phases, t, backend="sin", renorm_every=RENORM_EVERY,
+                   sample_rate=None):
+    """
+    Returns sum(w_h * sin(2π h f t + p_h)) over the given multipliers.
+    t must be a uniform time base (as built by np.linspace) for the
+    phasor backend. When sample_rate is given and t steps at
+    exactly 1/sample_rate from zero, the sin backend reads each
+    harmonic from the shared wavetable cache.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}, expected one of {BACKENDS}")
+
+    t = np.asarray(t, dtype=np.float64)
+    multipliers = list(multipliers)
+    weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), (len(multipliers),))
+    phases = np.broadcast_to(np.asarray(phases, dtype=np.float64), (len(multipliers),))
+    out = np.zeros_like(t)
+
+    if backend == "sin" or t.size < 2:
+        cached = sample_rate is not None and t.size > 1 and t[0] == 0 and abs(t[1] * sample_rate - 1) < 1e-12
+        for h, w, p in zip(multipliers, weights, phases):
+            if cached:
+                out += w * sine_samples(base_freq * h, t.size, sample_rate, p)
+            else:
+                out += w * np.sin(2 * np.pi * base_freq * h * t + p)
+        return out
+
+    if any(h != int(h) or h < 1 for h in multipliers):
+        raise ValueError(f"{backend} backend needs positive integer multipliers, got {multipliers}")
+
+    wanted = {}
+    for h, w, p in zip(multipliers, weights, phases):
+        wanted.setdefault(int(h), []).append((w * np.cos(p), w * np.sin(p)))
+
+    omega = 2 * np.pi * base_freq * (t[1] - t[0])
+    z1 = fundamental_phasor(omega, t.size, 2 * np.pi * base_freq * t[0])
+
+    _phasor_recursion(z1, wanted, out, renorm_every)
+    return out
+
+def _accumulate(out, s, c, terms):
+    # w sin(hx + p) = (w cos p) sin(hx) + (w sin p) cos(hx)
+    for ws, wc in terms:
+        if ws:
+            out += ws * s
+        if wc:
+            out += wc * c
+
+def _phasor_recursion(z1, wanted, out, renorm_every):
+    z = z1.copy()
+    for h in range(1, max(wanted) + 1):
+        if h > 1:
+            np.multiply(z, z1, out=z)
+            if renorm_every and h % renorm_every == 0:
+                z /= np.abs(z)
+        if h in wanted:
+            _accumulate(out, z.imag, z.real, wanted[h])
+
+# ------------------------------
+# BENCHMARK
+# ------------------------------
+
+def benchmark_backends(sample_rates=(192000, 1_000_000), duration=0.05, base_freq=3330,
+                       multipliers=(1, 2, 3, 6, 9, 18, 27), repeats=5):
+    import time
+
+    results = []
+    for sample_rate in sample_rates:
+        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+        weights = 1.0 / np.arange(1, len(multipliers) + 1)
+        reference = harmonic_stack(base_freq, multipliers, weights, 0.0, t, backend="sin")
+
+        for backend in BACKENDS:
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                wave = harmonic_stack(base_freq, multipliers, weights, 0.0, t, backend=backend)
+                timings.append(time.perf_counter() - start)
+            error = np.max(np.abs(wave - reference))
+            results.append((sample_rate, backend, min(timings), error))
+    return results
+
+# ------------------------------
+# MAIN EXECUTION
+# ------------------------------
+
+if __name__ == "__main__":
+    print(f"{'rate (Hz)':>10} {'backend':>10} {'time (ms)':>10} {'max |err|':>10}")
+    for sample_rate, backend, elapsed, error in benchmark_backends():
+        print(f"{sample_rate:>10} {backend:>10} {elapsed * 1000:>10.2f} {error:>10.1e}")
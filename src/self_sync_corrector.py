@@ -20,7 +20,9 @@ Real-world inspiration:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import decimate, finish_figure
+from .waveform_cache import time_base
 
 # ------------------------------
 # CONFIGURATION
@@ -33,7 +35,7 @@ CORRECTION_GAIN = 0.25
 PHASE_SHIFT = np.pi / 6  # 30 degrees
 
 def generate_unstable_wave(freq, duration, sample_rate):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+    t = time_base(duration, sample_rate)
     noisy_wave = np.sin(2 * np.pi * freq * t + np.sin(t * 40))  # injected wobble
     return t, noisy_wave
 
@@ -41,21 +43,30 @@ def apply_self_correction(wave, gain, shift):
     corrected = wave + gain * np.sin(np.angle(wave + shift))
     return corrected
 
+def self_sync_step():
+    """
+    One control cycle: correct a fresh DURATION window of the field
+    """
+    _, wave = generate_unstable_wave(FREQ, DURATION, SAMPLE_RATE)
+    return apply_self_correction(wave, CORRECTION_GAIN, PHASE_SHIFT)
+
 # ------------------------------
 # VISUALIZATION
 # ------------------------------
 
-def plot_correction(t, original, corrected):
+def plot_correction(t, original, corrected, save_path=None):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, original, label="Unstable Input", alpha=0.5)
-    plt.plot(t * 1000, corrected, label="Corrected Output", color="green")
+    plt.plot(*decimate(t * 1000, original), label="Unstable Input", alpha=0.5)
+    plt.plot(*decimate(t * 1000, corrected), label="Corrected Output", color="green")
     plt.title("Self-Sync Corrector — Real-Time Phase Correction")
     plt.xlabel("Time (ms)")
     plt.ylabel("Amplitude")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
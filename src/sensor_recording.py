@@ -0,0 +1,173 @@
+# sensor_recording.py
+# Binary capture and memory-mapped replay of sensor streams — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+Records flux-ring and IMU streams to disk so field incidents can be
+replayed exactly.
+
+File layout:
+- 64-byte header: magic, version, sensor type, channel count,
+  sample rate, dtype, capture start time (unix seconds)
+- Fixed-stride frames: (channels,) values of `dtype`, back to back
+
+Recording is append-only bulk writes. Replay maps the frame region
+with np.memmap, so multi-GB captures can be sliced by time or scanned
+chunk by chunk without loading them.
+
+SensorReplay exposes the same calls as the live sources:
+- read_imu()               — inertia_cancel_core.read_imu
+- read_flux_ring(n)        — flux_lens_feedback.read_flux_ring
+- read_batch(frames)       — SensorProducer / read_*_batch
+"""
+
+import os
+import struct
+import time
+
+import numpy as np
+
+# ------------------------------
+# FORMAT
+# ------------------------------
+
+MAGIC = b"IXAGREC\0"
+VERSION = 1
+HEADER = struct.Struct("<8sHBxIdd8s")
+HEADER_SIZE = 64                   # HEADER padded so frames start aligned
+
+SENSOR_TYPES = {"imu": 1, "flux": 2}
+SENSOR_NAMES = {code: name for name, code in SENSOR_TYPES.items()}
+
+# ------------------------------
+# RECORDING
+# ------------------------------
+
+class SensorRecorder:
+    """
+    Writes a capture file: header once, then bulk frame appends
+    """
+
+    def __init__(self, path, sensor, channels, sample_rate, dtype=np.float64, start_time=None):
+        if sensor not in SENSOR_TYPES:
+            raise ValueError(f"unknown sensor {sensor!r}, expected one of {sorted(SENSOR_TYPES)}")
+        self.path = path
+        self.channels = channels
+        self.dtype = np.dtype(dtype).newbyteorder("<")
+        self.frames_written = 0
+
+        header = HEADER.pack(MAGIC, VERSION, SENSOR_TYPES[sensor], channels, float(sample_rate),
+                             time.time() if start_time is None else start_time, self.dtype.str.encode())
+        self._file = open(path, "wb")
+        self._file.write(header.ljust(HEADER_SIZE, b"\0"))
+
+    def append(self, frames):
+        frames = np.ascontiguousarray(frames, dtype=self.dtype).reshape(-1, self.channels)
+        self._file.write(memoryview(frames).cast("B"))
+        self.frames_written += len(frames)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ------------------------------
+# REPLAY
+# ------------------------------
+
+class SensorReplay:
+    """
+    Memory-mapped view of a capture file plus a read cursor
+    """
+
+    def __init__(self, path, loop=False):
+        with open(path, "rb") as f:
+            raw = f.read(HEADER.size)
+        magic, version, sensor, channels, sample_rate, start_time, dtype = HEADER.unpack(raw)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} sensor capture")
+
+        self.path = path
+        self.sensor = SENSOR_NAMES[sensor]
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.start_time = start_time
+        self.dtype = np.dtype(dtype.rstrip(b"\0").decode())
+        self.loop = loop
+        self.cursor = 0
+
+        stride = channels * self.dtype.itemsize
+        count = (os.path.getsize(path) - HEADER_SIZE) // stride
+        if count > 0:
+            self.frames = np.memmap(path, dtype=self.dtype, mode="r", offset=HEADER_SIZE, shape=(count, channels))
+        else:
+            self.frames = np.empty((0, channels), dtype=self.dtype)
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def duration(self):
+        return len(self.frames) / self.sample_rate
+
+    def slice_time(self, t_start, t_stop=None):
+        """
+        Frames in [t_start, t_stop) seconds from the capture start (view)
+        """
+        start = max(int(np.ceil(t_start * self.sample_rate)), 0)
+        stop = len(self.frames) if t_stop is None else int(np.ceil(t_stop * self.sample_rate))
+        return self.frames[start:stop]
+
+    def chunks(self, frames_per_chunk):
+        for start in range(0, len(self.frames), frames_per_chunk):
+            yield self.frames[start:start + frames_per_chunk]
+
+    # -- live-source compatible reads --
+
+    def read_batch(self, frames):
+        if self.loop and self.cursor >= len(self.frames):
+            self.cursor = 0
+        batch = self.frames[self.cursor:self.cursor + frames]
+        self.cursor += len(batch)
+        return batch
+
+    def _next_frame(self):
+        frame = self.read_batch(1)
+        if len(frame) == 0:
+            raise EOFError(f"end of capture {self.path}")
+        return np.array(frame[0], dtype=np.float64)
+
+    def read_imu(self):
+        frame = self._next_frame()
+        return frame[:3], frame[3:6]
+
+    def read_flux_ring(self, num_sensors=8):
+        return self._next_frame()[:num_sensors]
+
+# ------------------------------
+# MAIN TEST
+# ------------------------------
+
+if __name__ == "__main__":
+    import tempfile
+
+    from .inertia_cancel_core import IMU_FRAME_WIDTH, compute_counter_field, read_imu_batch
+
+    path = os.path.join(tempfile.gettempdir(), "imu_capture.ixrec")
+    with SensorRecorder(path, "imu", IMU_FRAME_WIDTH, 10000) as recorder:
+        for _ in range(100):
+            recorder.append(read_imu_batch(1000))
+
+    replay = SensorReplay(path)
+    window = replay.slice_time(2.5, 2.6)
+    print(f"Capture: {len(replay)} {replay.sensor} frames, {replay.duration:.1f} s at {replay.sample_rate:.0f} Hz")
+    print(f"Window 2.5–2.6 s: {window.shape}, memory-mapped: {isinstance(window, np.memmap)}")
+
+    accel, gyro = replay.read_imu()
+    print(f"First frame counter field: {compute_counter_field(accel)}")
+    os.remove(path)
@@ -0,0 +1,156 @@
+# sensor_ring_buffer.py
+# Preallocated ring-buffer ingest for flux-ring and IMU sensor frames — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+Fixed-capacity numpy ring buffer between a sensor producer thread
+and batch consumers.
+
+- Storage is allocated once: (capacity, *frame_shape)
+- The producer bulk-copies frames into free slots; frames that do
+  not fit are dropped and counted in `overruns` (slots a consumer
+  is still reading are never overwritten)
+- Consumers get contiguous zero-copy views of unread frames and
+  hand the slots back with release()
+
+Frame layouts:
+- Flux ring : (num_sensors,)  — flux_lens_feedback.read_flux_ring_batch
+- 6-DOF IMU : (6,) = ax, ay, az, gx, gy, gz — inertia_cancel_core.read_imu_batch
+"""
+
+import threading
+
+import numpy as np
+
+# ------------------------------
+# CONFIGURATION
+# ------------------------------
+
+RING_CAPACITY = 4096              # Frames held before the producer starts dropping
+PRODUCER_BATCH = 64               # Frames fetched per producer read
+
+# ------------------------------
+# RING BUFFER
+# ------------------------------
+
+class FrameRingBuffer:
+    """
+    Single-producer / single-consumer ring of fixed-shape frames
+    """
+
+    def __init__(self, capacity=RING_CAPACITY, frame_shape=(), dtype=np.float64):
+        self.capacity = capacity
+        self.frames = np.empty((capacity,) + tuple(frame_shape), dtype=dtype)
+        self._cond = threading.Condition()
+        self._head = 0          # total frames ever written
+        self._tail = 0          # total frames ever released
+        self.overruns = 0
+
+    def available(self):
+        with self._cond:
+            return self._head - self._tail
+
+    def write(self, frames):
+        """
+        Copies as many frames as fit; returns the number stored
+        """
+        frames = np.asarray(frames)
+        with self._cond:
+            free = self.capacity - (self._head - self._tail)
+            head = self._head
+
+        count = min(len(frames), free)
+        start = head % self.capacity
+        first = min(count, self.capacity - start)
+        self.frames[start:start + first] = frames[:first]
+        self.frames[:count - first] = frames[first:count]
+
+        with self._cond:
+            self._head += count
+            self.overruns += len(frames) - count
+            self._cond.notify_all()
+        return count
+
+    def read(self, max_frames=None, timeout=None):
+        """
+        Returns a contiguous view of up to max_frames unread frames
+        (empty on timeout). The view stays valid until release().
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._head > self._tail, timeout):
+                return self.frames[:0]
+            start = self._tail % self.capacity
+            count = min(self._head - self._tail, self.capacity - start)
+        if max_frames is not None:
+            count = min(count, max_frames)
+        return self.frames[start:start + count]
+
+    def release(self, count):
+        with self._cond:
+            self._tail += min(count, self._head - self._tail)
+            self._cond.notify_all()
+
+# ------------------------------
+# PRODUCER THREAD
+# ------------------------------
+
+class SensorProducer(threading.Thread):
+    """
+    Polls read_batch(batch_frames) and pushes the result into a ring
+    """
+
+    def __init__(self, ring, read_batch, batch_frames=PRODUCER_BATCH, interval=None):
+        super().__init__(daemon=True)
+        self.ring = ring
+        self.read_batch = read_batch
+        self.batch_frames = batch_frames
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self.ring.write(self.read_batch(self.batch_frames))
+            if self.interval:
+                self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+# ------------------------------
+# MAIN TEST
+# ------------------------------
+
+if __name__ == "__main__":
+    from .flux_lens_feedback import compute_field_symmetry, generate_compensation_vector, read_flux_ring_batch
+    from .inertia_cancel_core import IMU_FRAME_WIDTH, compute_counter_field_batch, read_imu_batch
+
+    flux_ring = FrameRingBuffer(frame_shape=(8,))
+    imu_ring = FrameRingBuffer(frame_shape=(IMU_FRAME_WIDTH,))
+    producers = [
+        SensorProducer(flux_ring, read_flux_ring_batch, interval=0.001),
+        SensorProducer(imu_ring, read_imu_batch, interval=0.001),
+    ]
+    for producer in producers:
+        producer.start()
+
+    flux_frames = imu_frames = 0
+    for cycle in range(50):
+        batch = flux_ring.read(timeout=0.1)
+        avg_field, field_variation = compute_field_symmetry(batch)
+        correction = generate_compensation_vector(batch)
+        flux_frames += len(batch)
+        flux_ring.release(len(batch))
+
+        batch = imu_ring.read(timeout=0.1)
+        accel = batch[:, :3]
+        magnitudes, counter_fields = compute_counter_field_batch(accel)
+        imu_frames += len(batch)
+        imu_ring.release(len(batch))
+
+    for producer in producers:
+        producer.stop()
+
+    print(f"Flux frames consumed: {flux_frames}  (overruns: {flux_ring.overruns})")
+    print(f"IMU frames consumed:  {imu_frames}  (overruns: {imu_ring.overruns})")
@@ -15,6 +15,8 @@ dual toroidal EM spin-loops used in the IX-AntiGrav-Forge platform.
 
 import numpy as np
 
+from .waveform_cache import sine_wave, time_base
+
 # ------------------------------
 # CONFIGURATION
 # ------------------------------
@@ -33,26 +35,35 @@ PHASE_B = np.pi                  # 180° for Coil B (CCW)
 # ------------------------------
 
 def generate_spin_field(frequency, sample_rate, duration, amp, phase):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    signal = amp * np.sin(2 * np.pi * frequency * t + phase)
+    t = time_base(duration, sample_rate)
+    signal = amp * sine_wave(frequency, duration, sample_rate, phase)
     return t, signal
 
 # ------------------------------
-# MAIN EXECUTION
+# VISUALIZATION
 # ------------------------------
 
-if __name__ == "__main__":
-    t, spin_A = generate_spin_field(FREQUENCY_HZ, SAMPLE_RATE_HZ, DURATION_SEC, AMPLITUDE, PHASE_A)
-    _, spin_B = generate_spin_field(FREQUENCY_HZ, SAMPLE_RATE_HZ, DURATION_SEC, AMPLITUDE, PHASE_B)
-
+def plot_spin_pair(t, spin_A, spin_B, save_path=None):
     import matplotlib.pyplot as plt
+    from .plot_rendering import decimate, finish_figure
+
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, spin_A, label="Coil A (CW)", color='red')
-    plt.plot(t * 1000, spin_B, label="Coil B (CCW)", color='blue', linestyle='--')
+    plt.plot(*decimate(t * 1000, spin_A), label="Coil A (CW)", color='red')
+    plt.plot(*decimate(t * 1000, spin_B), label="Coil B (CCW)", color='blue', linestyle='--')
     plt.title("Dual Spin-Loop Field Signal (6 kHz, Opposing Phase)")
     plt.xlabel("Time (ms)")
     plt.ylabel("Amplitude")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
+
+# ------------------------------
+# MAIN EXECUTION
+# ------------------------------
+
+if __name__ == "__main__":
+    t, spin_A = generate_spin_field(FREQUENCY_HZ, SAMPLE_RATE_HZ, DURATION_SEC, AMPLITUDE, PHASE_A)
+    _, spin_B = generate_spin_field(FREQUENCY_HZ, SAMPLE_RATE_HZ, DURATION_SEC, AMPLITUDE, PHASE_B)
+
+    plot_spin_pair(t, spin_A, spin_B)
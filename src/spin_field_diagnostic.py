@@ -20,7 +20,10 @@ Real-world parallels:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .field_stability_audit import OnlineStabilityAuditor
+from .plot_rendering import decimate, finish_figure
+from .waveform_cache import sine_wave, time_base
 
 # ------------------------------
 # CONFIGURATION
@@ -32,8 +35,8 @@ DURATION = 0.01
 ASYM_LEVEL = 0.15
 
 def generate_spin_field(freq, duration, sample_rate, asym_level):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    base_spin = np.sin(2 * np.pi * freq * t)
+    t = time_base(duration, sample_rate)
+    base_spin = sine_wave(freq, duration, sample_rate)
     vortex_disruption = asym_level * np.sin(2 * np.pi * freq * t * 1.03)
     return t, base_spin + vortex_disruption
 
@@ -42,20 +45,28 @@ def detect_instability(spin_wave, threshold=0.04):
     variance = np.std(delta)
     return variance > threshold, variance
 
+def make_online_detector(channels=1, threshold=0.04, window=1024, sample_rate=SAMPLE_RATE, mode="window"):
+    """
+    Streaming counterpart of detect_instability for live spin channels
+    """
+    return OnlineStabilityAuditor(channels, threshold, window, sample_rate=sample_rate, mode=mode)
+
 # ------------------------------
 # VISUALIZATION
 # ------------------------------
 
-def plot_spin_field(t, wave, variance):
+def plot_spin_field(t, wave, variance, save_path=None):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, wave, label="Spin Field Envelope")
+    plt.plot(*decimate(t * 1000, wave), label="Spin Field Envelope")
     plt.title(f"Spin Field Diagnostic — Variance: {variance:.4f}")
     plt.xlabel("Time (ms)")
     plt.ylabel("Amplitude")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
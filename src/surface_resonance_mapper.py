@@ -20,7 +20,9 @@ Compatible with:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import finish_figure, grid_stride
+from .tiled_field import TILE_CELLS, band_rows, field_outputs
 
 # ------------------------------
 # SIMULATED MATERIAL GRID
@@ -29,6 +31,17 @@ import matplotlib.pyplot as plt
 GRID_SIZE = 64
 BASE_RESONANCE = 0.45
 VARIANCE = 0.25
+ZONE_THRESHOLD = 0.6       # Response level that counts as a resonance zone
+MIN_ZONE_AREA = 4          # Zones smaller than this (cells) are dropped
+TOP_K = 10
+SWEEP_METHODS = ("auto", "direct", "recurrence")
+SWEEP_CELLS = 1 << 20      # (frequency × cell) values per sweep chunk
+SWEEP_BAND_CELLS = 1 << 15 # Cells per sweep band, kept cache-sized
+RESEED_EVERY = 64          # Recurrence steps between exact sin / cos reseeds
+
+# Per-zone record of scan_resonance_zones: centroid (row, col), cells, peak and its cell
+ZONE_DTYPE = np.dtype([("row", np.float64), ("col", np.float64), ("area", np.int64),
+                       ("peak", np.float64), ("peak_row", np.int64), ("peak_col", np.int64)])
 
 def simulate_material_surface(grid_size, base, variance):
     return np.clip(base + variance * np.random.randn(grid_size, grid_size), 0, 1)
@@ -44,17 +57,238 @@ def simulate_response_field(surface_grid, freq_bias=0.333):
     response = np.sin(2 * np.pi * freq_bias * surface_grid) * surface_grid
     return np.clip(response, 0, 1)
 
+# ------------------------------
+# FREQUENCY SWEEP
+# ------------------------------
+
+def sweep_response_field(surface_grid, freq_biases, method="auto", chunk_cells=SWEEP_CELLS, directory=None):
+    """
+    Best freq_bias per cell over a sweep: returns (best_freq, peak) maps,
+    the argmax / max of simulate_response_field over freq_biases, without
+    building the (freqs, H, W) cube (maps go to .npy memmaps when
+    `directory` is given).
+
+    Cells are taken in row bands, the sweep in chunks of at most
+    chunk_cells values, and running max / argmax maps carry across
+    chunks; ties keep the first frequency, as np.argmax does.
+    "recurrence" steps sin(2π f s) across an evenly spaced sweep by
+    angle addition instead of calling sin, reseeding exactly every
+    RESEED_EVERY steps; "auto" picks it whenever the sweep is even.
+    """
+    if method not in SWEEP_METHODS:
+        raise ValueError(f"unknown method {method!r}, expected one of {SWEEP_METHODS}")
+    freqs = np.asarray(freq_biases, dtype=np.float64).ravel()
+    if not len(freqs):
+        raise ValueError("freq_biases is empty")
+
+    step = freqs[1] - freqs[0] if len(freqs) > 1 else 0.0
+    even = len(freqs) < 3 or np.allclose(np.diff(freqs), step, rtol=1e-9, atol=0)
+    if method == "auto":
+        method = "recurrence" if even and len(freqs) > 1 else "direct"
+    elif method == "recurrence" and not even:
+        raise ValueError("the recurrence needs evenly spaced freq_biases")
+
+    rows_total, cols = surface_grid.shape
+    maps = field_outputs(("best_freq", "peak"), (rows_total, cols), np.float64, directory)
+    rows = band_rows(cols, min(chunk_cells, SWEEP_BAND_CELLS))
+    for r0 in range(0, rows_total, rows):
+        band = np.asarray(surface_grid[r0:r0 + rows], dtype=np.float64)
+        if method == "direct":
+            best, arg = _sweep_direct(band, freqs, max(1, chunk_cells // band.size))
+        else:
+            best, arg = _sweep_recurrence(band, freqs, step)
+        arg[best <= 0] = 0  # every response clips to 0: np.argmax picks the first
+        maps["best_freq"][r0:r0 + rows] = freqs[arg]
+        maps["peak"][r0:r0 + rows] = np.clip(best, 0, 1)
+
+    for arr in maps.values():
+        if isinstance(arr, np.memmap):
+            arr.flush()
+    return maps["best_freq"], maps["peak"]
+
+def _sweep_direct(band, freqs, per_chunk):
+    omega = 2 * np.pi * freqs
+    best = np.full(band.shape, -np.inf)
+    arg = np.zeros(band.shape, dtype=np.int64)
+    better = np.empty(band.shape, dtype=bool)
+    for k0 in range(0, len(freqs), per_chunk):
+        values = np.sin(omega[k0:k0 + per_chunk, None, None] * band)
+        values *= band
+        # row-wise running update: argmax over the sweep axis is far slower
+        for k, value in enumerate(values, k0):
+            np.greater(value, best, out=better)
+            np.copyto(best, value, where=better)
+            np.copyto(arg, k, where=better)
+    return best, arg
+
+def _sweep_recurrence(band, freqs, step):
+    # sin((ω + δ)s) = sin(ωs) cos(δs) + cos(ωs) sin(δs), and likewise for cos
+    omega = 2 * np.pi * freqs
+    delta = 2 * np.pi * step * band
+    sin_d, cos_d = np.sin(delta), np.cos(delta)
+    best = np.full(band.shape, -np.inf)
+    arg = np.zeros(band.shape, dtype=np.int64)
+    value, tmp = np.empty_like(band), np.empty_like(band)
+    better = np.empty(band.shape, dtype=bool)
+
+    for k in range(len(freqs)):
+        if k % RESEED_EVERY == 0:
+            phase = omega[k] * band
+            sin, cos = np.sin(phase), np.cos(phase)
+        else:
+            np.multiply(sin, sin_d, out=tmp)
+            np.multiply(cos, sin_d, out=value)
+            sin *= cos_d
+            sin += value
+            cos *= cos_d
+            cos -= tmp
+        np.multiply(sin, band, out=value)
+        np.greater(value, best, out=better)
+        np.copyto(best, value, where=better)
+        np.copyto(arg, k, where=better)
+    return best, arg
+
+# ------------------------------
+# TILED ZONE SCAN
+# ------------------------------
+
+def material_surface_bands(grid_size, base=BASE_RESONANCE, variance=VARIANCE, seed=None, tile_cells=TILE_CELLS):
+    """
+    simulate_material_surface streamed as row bands from a seeded
+    generator (the same surface whatever the band height)
+    """
+    rng = np.random.default_rng(seed)
+    rows = band_rows(grid_size, tile_cells)
+    for r0 in range(0, grid_size, rows):
+        yield np.clip(base + variance * rng.standard_normal((min(rows, grid_size - r0), grid_size)), 0, 1)
+
+def _zone_records(area, sum_r, sum_c, peak, peak_r, peak_c):
+    zones = np.empty(len(area), dtype=ZONE_DTYPE)
+    zones["row"] = sum_r / area
+    zones["col"] = sum_c / area
+    zones["area"] = area
+    zones["peak"] = peak
+    zones["peak_row"] = peak_r
+    zones["peak_col"] = peak_c
+    return zones
+
+def _keep_top(top, zones, k):
+    # bounded top-k: the held zones plus this band's, cut back to k (earlier zones win ties)
+    merged = np.concatenate([top, zones])
+    return merged[np.argsort(-merged["peak"], kind="stable")[:k]]
+
+def scan_resonance_zones(surface, threshold=ZONE_THRESHOLD, freq_bias=0.333, top_k=TOP_K,
+                         min_area=MIN_ZONE_AREA, tile_cells=TILE_CELLS):
+    """
+    Streams a surface (a 2D array or memmap, or an iterable of row
+    bands) through simulate_response_field and finds the 4-connected
+    zones where the response exceeds `threshold`.
+
+    Each band is labelled on its own; labels that meet across a band
+    border are joined, and only zones still touching the latest band
+    stay open. Finished zones only feed a bounded top-k table, so
+    memory is one band, the open zones and k records, never the
+    response map or the full zone list. Returns (top, zone_count): the
+    `top_k` strongest-peak zones of at least `min_area` cells as
+    ZONE_DTYPE records, strongest first, and how many such zones there
+    were.
+    """
+    from scipy import ndimage
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    bands = surface
+    if getattr(surface, "ndim", None) == 2:
+        rows = band_rows(surface.shape[1], tile_cells)
+        bands = (surface[r0:r0 + rows] for r0 in range(0, surface.shape[0], rows))
+
+    top = np.empty(0, dtype=ZONE_DTYPE)
+    zone_count = 0
+    open_stats = [np.empty(0, dtype=np.int64), np.empty(0), np.empty(0),
+                  np.empty(0), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)]
+    open_bottom = None  # open-zone index per column of the last row, -1 where none
+    r0 = 0
+
+    for band in bands:
+        response = simulate_response_field(np.asarray(band, dtype=np.float64), freq_bias)
+        height, width = response.shape
+        labels, n = ndimage.label(response > threshold)
+
+        # per-label statistics of this band
+        cells = np.flatnonzero(labels)
+        lab = labels.ravel()[cells]
+        val = response.ravel()[cells]
+        rr, cc = np.divmod(cells, width)
+        rr += r0
+        area = np.bincount(lab, minlength=n + 1)[1:]
+        sum_r = np.bincount(lab, rr, minlength=n + 1)[1:]
+        sum_c = np.bincount(lab, cc, minlength=n + 1)[1:]
+        peak = np.full(n + 1, -np.inf)
+        np.maximum.at(peak, lab, val)
+        hits = np.flatnonzero(val == peak[lab])
+        first = np.unique(lab[hits], return_index=True)[1]
+        peak_r = rr[hits[first]]
+        peak_c = cc[hits[first]]
+
+        # join open zones from the band above with labels on this band's top row
+        m = len(open_stats[0])
+        if open_bottom is not None:
+            above, below = open_bottom, labels[0]
+            touch = (above >= 0) & (below > 0)
+            a, b = above[touch], m + below[touch] - 1
+        else:
+            a = b = np.empty(0, dtype=np.int64)
+        graph = coo_matrix((np.ones(len(a)), (a, b)), shape=(m + n, m + n))
+        count, comp = connected_components(graph, directed=False)
+
+        stats = [np.concatenate([old, new]) for old, new in
+                 zip(open_stats, (area, sum_r, sum_c, peak[1:], peak_r, peak_c))]
+        merged_area = np.bincount(comp, stats[0], minlength=count).astype(np.int64)
+        merged_r = np.bincount(comp, stats[1], minlength=count)
+        merged_c = np.bincount(comp, stats[2], minlength=count)
+        best = np.lexsort((-stats[3], comp))
+        first = np.ones(len(best), dtype=bool)
+        first[1:] = comp[best][1:] != comp[best][:-1]
+        best = best[first]
+        merged = [merged_area, merged_r, merged_c, stats[3][best], stats[4][best], stats[5][best]]
+
+        # zones touching this band's bottom row stay open; the rest are final
+        bottom = labels[-1]
+        bottom_comp = np.full(width, -1, dtype=np.int64)
+        bottom_comp[bottom > 0] = comp[m + bottom[bottom > 0] - 1]
+        still_open = np.zeros(count, dtype=bool)
+        still_open[bottom_comp[bottom_comp >= 0]] = True
+        done = ~still_open & (merged_area >= min_area)
+        zone_count += int(np.count_nonzero(done))
+        top = _keep_top(top, _zone_records(*(x[done] for x in merged)), top_k)
+
+        reindex = np.cumsum(still_open) - 1
+        open_stats = [x[still_open] for x in merged]
+        open_bottom = bottom_comp.copy()
+        open_bottom[bottom_comp >= 0] = reindex[bottom_comp[bottom_comp >= 0]]
+        r0 += height
+
+    if open_bottom is not None:
+        keep = open_stats[0] >= min_area
+        zone_count += int(np.count_nonzero(keep))
+        top = _keep_top(top, _zone_records(*(x[keep] for x in open_stats)), top_k)
+    return top, zone_count
+
 # ------------------------------
 # VISUALIZE MAPPED ZONES
 # ------------------------------
 
-def visualize_field_map(response_map):
+def visualize_field_map(response_map, save_path=None):
+    import matplotlib.pyplot as plt
+
+    s = grid_stride(response_map.shape)
     plt.figure(figsize=(6, 6))
-    plt.imshow(response_map, cmap='viridis')
+    rows, cols = response_map.shape
+    plt.imshow(response_map[::s, ::s], cmap='viridis', extent=(-0.5, cols - 0.5, rows - 0.5, -0.5))
     plt.colorbar(label="Resonance Strength")
     plt.title("Mapped Surface Resonance Zones")
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
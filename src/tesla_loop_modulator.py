@@ -16,6 +16,10 @@ Applications:
 
 import numpy as np
 
+from .harmonic_stream import FRAME_SIZE, HarmonicFrameStream
+from .recursive_oscillator import harmonic_stack
+from .waveform_cache import time_base
+
 # ------------------------------
 # CONFIGURATION
 # ------------------------------
@@ -25,17 +29,20 @@ DURATION = 0.015   # 15ms loop
 SAMPLE_RATE = 192000
 HARMONIC_WEIGHTS = [1.0, 0.7, 0.5]  # For 3x, 6x, 9x modulation
 
-def generate_369_loop(freq, weights, duration, sample_rate):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    signal = np.zeros_like(t)
-
-    for idx, mult in enumerate([1, 2, 3]):
-        harmonic_freq = freq * mult
-        signal += weights[idx] * np.sin(2 * np.pi * harmonic_freq * t)
+def generate_369_loop(freq, weights, duration, sample_rate, backend="sin"):
+    t = time_base(duration, sample_rate)
+    signal = harmonic_stack(freq, [1, 2, 3], weights[:3], 0.0, t, backend=backend, sample_rate=sample_rate)
 
     signal /= sum(weights)
     return t, signal
 
+def stream_369_loop(freq, weights, sample_rate, frame_size=FRAME_SIZE):
+    """
+    Endless, phase-continuous frame source equivalent to generate_369_loop
+    """
+    freqs = [freq * mult for mult in [1, 2, 3]]
+    return HarmonicFrameStream(freqs, weights, 0.0, sample_rate, frame_size, norm=sum(weights))
+
 def reinforce_signal(signal, gain=0.2):
     """
     Applies reinforcement loop to simulate energy return
@@ -45,20 +52,29 @@ def reinforce_signal(signal, gain=0.2):
     return signal + feedback
 
 # ------------------------------
-# MAIN EXECUTION
+# VISUALIZATION
 # ------------------------------
 
-if __name__ == "__main__":
-    t, base_wave = generate_369_loop(BASE_FREQ, HARMONIC_WEIGHTS, DURATION, SAMPLE_RATE)
-    modulated_wave = reinforce_signal(base_wave)
-
+def plot_369_loop(t, modulated_wave, save_path=None):
     import matplotlib.pyplot as plt
+    from .plot_rendering import decimate, finish_figure
+
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, modulated_wave, label="Reinforced Tesla 3-6-9 Loop", color="red")
+    plt.plot(*decimate(t * 1000, modulated_wave), label="Reinforced Tesla 3-6-9 Loop", color="red")
     plt.title("Tesla Harmonic Loop Modulator — 3-6-9 Phase Reinforcement")
     plt.xlabel("Time (ms)")
     plt.ylabel("Amplitude")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
+
+# ------------------------------
+# MAIN EXECUTION
+# ------------------------------
+
+if __name__ == "__main__":
+    t, base_wave = generate_369_loop(BASE_FREQ, HARMONIC_WEIGHTS, DURATION, SAMPLE_RATE)
+    modulated_wave = reinforce_signal(base_wave)
+
+    plot_369_loop(t, modulated_wave)
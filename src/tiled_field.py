@@ -0,0 +1,83 @@
+# tiled_field.py
+# Out-of-core, tile-by-tile evaluation of 2D field maps — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+Evaluates f(x, y) field maps without ever building full meshgrids.
+
+- The grid is walked in row bands of about TILE_CELLS cells; each
+  band sees a (1, cols) x row and a (rows, 1) y column and the
+  kernel broadcasts them, so temporaries are band-sized
+- Outputs go to .npy memmaps in `directory` (np.load(..., mmap_mode="r")
+  reopens them) or to RAM when no directory is given
+- Kernels that need neighbours (finite differences) ask for a `halo`:
+  they are handed `halo` extra rows either side and the band is cut
+  back out, so results match a whole-grid evaluation exactly
+
+Peak RAM is a few band-sized temporaries regardless of resolution;
+a 20k × 20k map is only bounded by disk.
+"""
+
+import os
+
+import numpy as np
+
+# ------------------------------
+# CONFIGURATION
+# ------------------------------
+
+TILE_CELLS = 1 << 20              # Cells per row band (~8 MB per float64 temporary)
+
+# ------------------------------
+# OUTPUT ALLOCATION
+# ------------------------------
+
+def field_outputs(names, shape, dtype=np.float64, directory=None):
+    """
+    {name: array of `shape`}; .npy memmaps under `directory` when given
+    """
+    if directory is None:
+        return {name: np.empty(shape, dtype=dtype) for name in names}
+    os.makedirs(directory, exist_ok=True)
+    return {name: np.lib.format.open_memmap(os.path.join(directory, f"{name}.npy"), mode="w+",
+                                            dtype=dtype, shape=shape)
+            for name in names}
+
+def band_rows(cols, tile_cells=TILE_CELLS):
+    return max(1, tile_cells // max(cols, 1))
+
+# ------------------------------
+# TILED EVALUATION
+# ------------------------------
+
+def evaluate_tiled(kernel, names, x, y, dtype=np.float64, directory=None, out=None,
+                   tile_cells=TILE_CELLS, halo=0):
+    """
+    Fills one (len(y), len(x)) map per name with kernel(x_row, y_col).
+    kernel returns one array per name, broadcast to (band rows, cols).
+    Returns the {name: array} outputs.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    shape = (len(y), len(x))
+    outputs = field_outputs(names, shape, dtype, directory) if out is None else out
+    for name in names:
+        if outputs[name].shape != shape:
+            raise ValueError(f"output {name!r} has shape {outputs[name].shape}, expected {shape}")
+
+    x_row = x[None, :]
+    step = band_rows(len(x), tile_cells)
+    for r0 in range(0, shape[0], step):
+        r1 = min(r0 + step, shape[0])
+        lo, hi = max(r0 - halo, 0), min(r1 + halo, shape[0])
+        values = kernel(x_row, y[lo:hi, None])
+        if len(names) == 1 and not isinstance(values, tuple):
+            values = (values,)
+        for name, value in zip(names, values):
+            outputs[name][r0:r1] = np.broadcast_to(value, (hi - lo, shape[1]))[r0 - lo:r1 - lo]
+
+    for arr in outputs.values():
+        if isinstance(arr, np.memmap):
+            arr.flush()
+    return outputs
@@ -20,7 +20,9 @@ Inspired by:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import decimate, finish_figure
+from .waveform_cache import sine_wave, time_base
 
 # ------------------------------
 # CONFIGURATION
@@ -32,15 +34,14 @@ SAMPLE_RATE = 192000
 DURATION = 0.01
 
 def generate_spin_vector(freq, phase_offset, duration, sample_rate):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    return np.sin(2 * np.pi * freq * t + phase_offset)
+    return sine_wave(freq, duration, sample_rate, phase_offset)
 
 # ------------------------------
 # MAIN SPIN SYSTEM
 # ------------------------------
 
 def tri_axis_spin_system(freq, duration, sample_rate):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+    t = time_base(duration, sample_rate)
     x = generate_spin_vector(freq, PHASE_OFFSETS[0], duration, sample_rate)
     y = generate_spin_vector(freq, PHASE_OFFSETS[1], duration, sample_rate)
     z = generate_spin_vector(freq, PHASE_OFFSETS[2], duration, sample_rate)
@@ -50,18 +51,20 @@ def tri_axis_spin_system(freq, duration, sample_rate):
 # VISUALIZATION
 # ------------------------------
 
-def plot_spin_vectors(t, x, y, z):
+def plot_spin_vectors(t, x, y, z, save_path=None):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 5))
-    plt.plot(t * 1000, x, label="X-axis Spin", color="blue")
-    plt.plot(t * 1000, y, label="Y-axis Spin", color="green")
-    plt.plot(t * 1000, z, label="Z-axis Spin", color="red")
+    plt.plot(*decimate(t * 1000, x), label="X-axis Spin", color="blue")
+    plt.plot(*decimate(t * 1000, y), label="Y-axis Spin", color="green")
+    plt.plot(*decimate(t * 1000, z), label="Z-axis Spin", color="red")
     plt.title("Tri-Axis Spin Field — Phase Locked Tesla 3-6-9 Interlock")
     plt.xlabel("Time (ms)")
     plt.ylabel("Amplitude")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
 
 # ------------------------------
 # MAIN EXECUTION
@@ -17,7 +17,8 @@ Real-world parallels:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plot_rendering import finish_figure
 
 # ------------------------------
 # CONFIGURATION
@@ -42,7 +43,9 @@ def apply_corrections(forces, corrections):
 # VISUALIZATION
 # ------------------------------
 
-def plot_force_equalization(original, corrected):
+def plot_force_equalization(original, corrected, save_path=None):
+    import matplotlib.pyplot as plt
+
     labels = ['X', 'Y', 'Z']
     x = np.arange(len(labels))
     
@@ -57,7 +60,7 @@ def plot_force_equalization(original, corrected):
     ax.set_xticklabels(labels)
     ax.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path, fig)
 
 # ------------------------------
 # MAIN EXECUTION
@@ -21,6 +21,9 @@ Compatible with:
 
 import numpy as np
 
+from .harmonic_stream import FRAME_SIZE, HarmonicFrameStream
+from .waveform_cache import sine_wave, time_base
+
 # ------------------------------
 # CONFIGURATION
 # ------------------------------
@@ -32,16 +35,23 @@ SAMPLE_RATE = 192000
 DURATION = 0.02
 
 def generate_base_vortex_wave(freq_base, harmonics, duration, sample_rate):
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+    t = time_base(duration, sample_rate)
     signal = np.zeros_like(t)
 
     for h in harmonics:
         f = freq_base * h
-        signal += np.sin(2 * np.pi * f * t)
+        signal += sine_wave(f, duration, sample_rate)
 
     signal /= len(harmonics)
     return t, signal
 
+def stream_base_vortex_wave(freq_base, harmonics, sample_rate, frame_size=FRAME_SIZE):
+    """
+    Endless, phase-continuous frame source equivalent to generate_base_vortex_wave
+    """
+    freqs = [freq_base * h for h in harmonics]
+    return HarmonicFrameStream(freqs, 1.0, 0.0, sample_rate, frame_size, norm=len(harmonics))
+
 def apply_phase_binding(signal, phase_gain=PHASE_CORRECTION_GAIN):
     """
     Applies phase-corrective envelope to enforce toroidal symmetry
@@ -51,20 +61,29 @@ def apply_phase_binding(signal, phase_gain=PHASE_CORRECTION_GAIN):
     return signal * envelope
 
 # ------------------------------
-# MAIN EXECUTION
+# VISUALIZATION
 # ------------------------------
 
-if __name__ == "__main__":
-    t, base_wave = generate_base_vortex_wave(FREQ_BASE, HARMONICS, DURATION, SAMPLE_RATE)
-    bound_wave = apply_phase_binding(base_wave)
-
+def plot_binder_wave(t, bound_wave, save_path=None):
     import matplotlib.pyplot as plt
+    from .plot_rendering import decimate, finish_figure
+
     plt.figure(figsize=(10, 4))
-    plt.plot(t * 1000, bound_wave, label="Toroidal Binder Waveform", color="blue")
+    plt.plot(*decimate(t * 1000, bound_wave), label="Toroidal Binder Waveform", color="blue")
     plt.title("Toroid Binder — Phase-Locked Vortex Reinforcement Pattern")
     plt.xlabel("Time (ms)")
     plt.ylabel("Amplitude")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    return finish_figure(save_path)
+
+# ------------------------------
+# MAIN EXECUTION
+# ------------------------------
+
+if __name__ == "__main__":
+    t, base_wave = generate_base_vortex_wave(FREQ_BASE, HARMONICS, DURATION, SAMPLE_RATE)
+    bound_wave = apply_phase_binding(base_wave)
+
+    plot_binder_wave(t, bound_wave)
@@ -0,0 +1,191 @@
+# waveform_cache.py
+# Shared time-base and single-period wavetable cache — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+"""
+Bounded LRU cache for the arrays every generator keeps rebuilding:
+
+- Time bases: np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+- Wavetables: one exact period of a sampled sine, keyed by
+  (frequency, sample_rate, phase)
+
+A sampled sine at f Hz repeats exactly every q samples when
+f / sample_rate = p / q (p, q coprime). 3330 Hz at 192 kHz is
+111/6400, so 6400 samples hold exactly 111 cycles and any run of
+that tone is the table tiled end to end — a memcpy instead of a
+sin() per sample. Tones whose exact period would exceed
+MAX_TABLE_SAMPLES fall back to direct evaluation.
+
+Cached arrays are returned read-only; sine_wave() hands out a fresh
+writable copy. Hit / miss / eviction counters are exposed through
+cache_info() for sizing the cache in long-running processes.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+from fractions import Fraction
+
+import numpy as np
+
+# ------------------------------
+# CONFIGURATION
+# ------------------------------
+
+MAX_CACHE_BYTES = 64 * 1024 * 1024    # Total bytes held before LRU eviction
+MAX_TABLE_SAMPLES = 1 << 16           # Longest exact period stored as a wavetable
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions entries nbytes max_bytes")
+
+# ------------------------------
+# LRU ARRAY CACHE
+# ------------------------------
+
+def _entry_nbytes(value):
+    return sum(a.nbytes for a in value) if isinstance(value, tuple) else value.nbytes
+
+class LRUArrayCache:
+    """
+    Byte-bounded LRU store of read-only numpy arrays (or tuples of
+    arrays built together). With keep_oversized, an entry larger than
+    max_bytes is still kept, alone, until the next one evicts it.
+    """
+
+    def __init__(self, max_bytes=MAX_CACHE_BYTES, keep_oversized=False):
+        self.max_bytes = max_bytes
+        self.keep_oversized = keep_oversized
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key, builder):
+        with self._lock:
+            arr = self._entries.get(key)
+            if arr is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return arr
+            self.misses += 1
+
+        arr = builder()
+        for part in (arr if isinstance(arr, tuple) else (arr,)):
+            part.flags.writeable = False
+
+        nbytes = _entry_nbytes(arr)
+        with self._lock:
+            if key not in self._entries and (nbytes <= self.max_bytes or self.keep_oversized):
+                self._entries[key] = arr
+                self._nbytes += nbytes
+                self._evict()
+        return arr
+
+    def resize(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             len(self._entries), self._nbytes, self.max_bytes)
+
+    def _evict(self):
+        keep = 1 if self.keep_oversized else 0
+        while self._nbytes > self.max_bytes and len(self._entries) > keep:
+            _, old = self._entries.popitem(last=False)
+            self._nbytes -= _entry_nbytes(old)
+            self.evictions += 1
+
+_CACHE = LRUArrayCache()
+
+def cache_info():
+    return _CACHE.info()
+
+def clear_cache():
+    _CACHE.clear()
+
+def set_cache_limit(max_bytes):
+    _CACHE.resize(max_bytes)
+
+# ------------------------------
+# TIME BASES
+# ------------------------------
+
+def time_base(duration, sample_rate):
+    n = int(sample_rate * duration)
+    key = ("t", n, float(duration), float(sample_rate))
+    return _CACHE.get_or_build(key, lambda: np.linspace(0, duration, n, endpoint=False))
+
+# ------------------------------
+# WAVETABLES
+# ------------------------------
+
+def table_period(frequency, sample_rate, max_samples=MAX_TABLE_SAMPLES):
+    """
+    Returns (cycles, samples) of the exact sampled period, or None
+    """
+    ratio = Fraction(frequency) / Fraction(sample_rate)
+    if ratio.denominator > max_samples:
+        return None
+    return ratio.numerator, ratio.denominator
+
+def wavetable(frequency, sample_rate, phase=0.0):
+    """
+    One exact sampled period of sin(2π f k / sample_rate + phase), or None
+    when that period is longer than MAX_TABLE_SAMPLES
+    """
+    period = table_period(frequency, sample_rate)
+    if period is None:
+        return None
+    cycles, samples = period
+
+    def build():
+        # Reduce k*cycles modulo samples so the sin() argument stays within one turn
+        k = (np.arange(samples, dtype=np.int64) * cycles) % samples
+        return np.sin(2 * np.pi * k / samples + phase)
+
+    key = ("sin", float(frequency), float(sample_rate), float(phase))
+    return _CACHE.get_or_build(key, build)
+
+def sine_samples(frequency, n, sample_rate, phase=0.0):
+    """
+    sin(2π f k / sample_rate + phase) for k < n as a fresh writable array
+    """
+    table = wavetable(frequency, sample_rate, phase)
+    if table is None:
+        k = np.arange(n)
+        return np.sin(2 * np.pi * frequency * k / sample_rate + phase)
+    return np.resize(table, n)
+
+def sine_wave(frequency, duration, sample_rate, phase=0.0):
+    """
+    Drop-in for np.sin(2π f t + phase) over time_base(duration, sample_rate)
+    """
+    n = int(sample_rate * duration)
+    if n != sample_rate * duration:
+        # Truncated sample count: linspace step is not 1/sample_rate
+        return np.sin(2 * np.pi * frequency * time_base(duration, sample_rate) + phase)
+    return sine_samples(frequency, n, sample_rate, phase)
+
+# ------------------------------
+# MAIN TEST
+# ------------------------------
+
+if __name__ == "__main__":
+    for _ in range(3):
+        t = time_base(0.01, 192000)
+        for f in (3330, 6660, 9990):
+            wave = sine_wave(f, 0.01, 192000)
+            error = np.max(np.abs(wave - np.sin(2 * np.pi * f * t)))
+
+    print(f"Max wavetable error vs direct sin: {error:.2e}")
+    print(cache_info())
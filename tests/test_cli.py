@@ -0,0 +1,38 @@
+# test_cli.py
+# Batch store tests for the command line — IX-AntiGrav-Forge
+# Author: Bryce Wooster
+# License: Open-source, non-military use only
+
+import numpy as np
+
+from ixag import cli
+
+PARAM_SETS = [{"freq": 3330 + 10 * i, "duration": 0.001} for i in range(5)]
+
+def _run(store, **kwargs):
+    return cli.run_batch("tesla_loop_modulator", PARAM_SETS, str(store), workers=1, chunk_size=2, **kwargs)
+
+def test_stale_temp_files_are_not_chunks(tmp_path):
+    """
+    A write killed before os.replace leaves a temp file; it must not be
+    read back as a chunk, block a resume, or count as a finished chunk
+    """
+    _run(tmp_path)
+    (tmp_path / "chunk_00001.npz").unlink()
+    (tmp_path / ".chunk_00000.tmp.npz").write_bytes(b"cut short")
+    (tmp_path / "chunk_00002.npz.tmp.npz").write_bytes(b"older naming")
+
+    configs, skipped, _, _ = _run(tmp_path)
+    assert (configs, skipped) == (2, 2)
+
+    chunks = list(cli.iter_store(str(tmp_path)))
+    assert len(chunks) == 3
+    assert np.array_equal(np.concatenate([c["index"] for c in chunks]), np.arange(len(PARAM_SETS)))
+
+def test_rebuild_clears_temp_files(tmp_path):
+    _run(tmp_path)
+    (tmp_path / ".chunk_00007.tmp.npz").write_bytes(b"cut short")
+
+    _run(tmp_path, seed=1, rebuild=True)
+    assert not list(tmp_path.glob(".chunk_*"))
+    assert len(list(cli.iter_store(str(tmp_path)))) == 3